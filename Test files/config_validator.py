@@ -5,12 +5,72 @@ Run this before starting the automation system to catch configuration errors ear
 """
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-import yaml
 
-def load_yaml(path):
-    with open(path, 'r') as f:
-        return yaml.safe_load(f)
+# Use the app's own loader (JSON sidecar, encoding fallbacks) from src/
+_SRC = Path(__file__).resolve().parent.parent / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+from utils import load_yaml
+
+
+def _list_dir_lower(parent):
+    """Lowercased entry names of parent, or None if it can't be listed."""
+    try:
+        with os.scandir(parent) as it:
+            return {e.name.lower() for e in it}
+    except OSError:
+        return None
+
+
+def paths_exist(paths):
+    """Existence check for many files with one os.scandir per parent directory.
+
+    Names are compared case-insensitively (Windows filesystem semantics).
+    Distinct parents are listed concurrently — each listing is a blocking
+    syscall that releases the GIL, and on Windows (AV scanning, network
+    drives) it can take several ms. Parents that can't be listed (missing,
+    PermissionError) fall back to os.path.exists for their files."""
+    split = [os.path.split(path) for path in paths]
+    parents = list(dict.fromkeys(parent or "." for parent, _ in split))
+    if len(parents) > 1:
+        with ThreadPoolExecutor(max_workers=min(4, len(parents))) as ex:
+            listings = dict(zip(parents, ex.map(_list_dir_lower, parents)))
+    else:
+        listings = {parent: _list_dir_lower(parent) for parent in parents}
+
+    results = []
+    for path, (parent, name) in zip(paths, split):
+        names = listings[parent or "."]
+        if names is None or not name:
+            results.append(os.path.exists(path))
+        else:
+            results.append(name.lower() in names)
+    return results
+
+
+def absolute_click_indices(clicks):
+    """Indices of clicks with x/y > 10 — likely absolute pixels, not pct.
+
+    Vectorized with NumPy once the list is long enough to pay for building
+    the arrays; a plain loop is faster for a handful of clicks."""
+    if len(clicks) < 4:
+        return [
+            i for i, c in enumerate(clicks)
+            if "x" in c and "y" in c and (c["x"] > 10 or c["y"] > 10)
+        ]
+
+    import numpy as np
+
+    n = len(clicks)
+    has_xy = np.fromiter(("x" in c and "y" in c for c in clicks), dtype=bool, count=n)
+    xs = np.fromiter((c.get("x", 0) for c in clicks), dtype=np.float32, count=n)
+    ys = np.fromiter((c.get("y", 0) for c in clicks), dtype=np.float32, count=n)
+    return np.flatnonzero(has_xy & ((xs > 10) | (ys > 10))).tolist()
+
 
 def validate_config():
     """Validate all configuration files and paths."""
@@ -81,13 +141,17 @@ def validate_config():
             if not os.path.exists(panel_dir):
                 errors.append(f"Panel directory not found: {panel_dir}")
             else:
-                # Check for .exe files
-                exes = list(Path(panel_dir).glob("*.exe"))
+                # Check for .exe files — one scandir pass, DirEntry caches stat
+                exes = [
+                    (e.name, e.stat().st_mtime)
+                    for e in os.scandir(panel_dir)
+                    if e.name.lower().endswith(".exe") and e.is_file(follow_symlinks=False)
+                ]
                 if not exes:
                     errors.append(f"No .exe files found in panel directory: {panel_dir}")
                 else:
                     print(f"   ✅ Found {len(exes)} .exe file(s) in panel directory")
-                    print(f"      Latest: {sorted(exes, key=lambda p: p.stat().st_mtime, reverse=True)[0].name}")
+                    print(f"      Latest: {max(exes, key=itemgetter(1))[0]}")
         else:
             errors.append("regions.yaml: panel.dir not specified")
         
@@ -96,48 +160,29 @@ def validate_config():
             fr = panel["first_run"]
             if "clicks" in fr:
                 clicks = fr["clicks"]
-                for i, click in enumerate(clicks):
-                    # Check if using absolute coordinates (should use percentages)
-                    if "x" in click and "y" in click:
-                        if click["x"] > 10 or click["y"] > 10:  # Likely absolute coords
-                            warnings.append(
-                                f"regions.yaml: panel.first_run.clicks[{i}] uses absolute coordinates "
-                                f"(x={click['x']}, y={click['y']}). Consider using x_pct/y_pct for "
-                                f"screen resolution independence."
-                            )
+                # Check if using absolute coordinates (should use percentages)
+                for i in absolute_click_indices(clicks):
+                    click = clicks[i]
+                    warnings.append(
+                        f"regions.yaml: panel.first_run.clicks[{i}] uses absolute coordinates "
+                        f"(x={click['x']}, y={click['y']}). Consider using x_pct/y_pct for "
+                        f"screen resolution independence."
+                    )
     
+    # Executable paths: collected first, then checked with one directory
+    # listing per parent instead of one stat() per file.
+    exe_checks = []
+
     if "paths" in regions:
         paths = regions["paths"]
-        
-        # Validate ExpressVPN path
-        if "expressvpn_exe" in paths:
-            vpn_paths = paths["expressvpn_exe"]
-            if isinstance(vpn_paths, list) and vpn_paths:
-                vpn_path = vpn_paths[0]
-                if not os.path.exists(vpn_path):
-                    errors.append(f"ExpressVPN executable not found: {vpn_path}")
-                else:
-                    print(f"   ✅ ExpressVPN executable found")
-        
-        # Validate MemReduct path
-        if "memreduct_exe" in paths:
-            mem_paths = paths["memreduct_exe"]
-            if isinstance(mem_paths, list) and mem_paths:
-                mem_path = mem_paths[0]
-                if not os.path.exists(mem_path):
-                    errors.append(f"MemReduct executable not found: {mem_path}")
-                else:
-                    print(f"   ✅ MemReduct executable found")
-        
-        # Validate RDPClient path
-        if "rdpclient_exe" in paths:
-            rdp_paths = paths["rdpclient_exe"]
-            if isinstance(rdp_paths, list) and rdp_paths:
-                rdp_path = rdp_paths[0]
-                if not os.path.exists(rdp_path):
-                    errors.append(f"RDPClient executable not found: {rdp_path}")
-                else:
-                    print(f"   ✅ RDPClient executable found")
+        for key, label in (
+            ("expressvpn_exe", "ExpressVPN"),
+            ("memreduct_exe", "MemReduct"),
+            ("rdpclient_exe", "RDPClient"),
+        ):
+            candidates = paths.get(key)
+            if isinstance(candidates, list) and candidates:
+                exe_checks.append((label, candidates[0]))
     else:
         warnings.append("regions.yaml: 'paths' section not found")
     
@@ -146,10 +191,15 @@ def validate_config():
         sr = regions["steam_route"]
         if sr.get("launch_with_panel"):
             exe = sr.get("exe")
-            if exe and not os.path.exists(exe):
-                errors.append(f"Steam Route executable not found: {exe}")
-            elif exe:
-                print(f"   ✅ Steam Route executable found")
+            if exe:
+                exe_checks.append(("Steam Route", exe))
+
+    found = paths_exist([path for _, path in exe_checks])
+    for (label, path), ok in zip(exe_checks, found):
+        if not ok:
+            errors.append(f"{label} executable not found: {path}")
+        else:
+            print(f"   ✅ {label} executable found")
     
     # Check for required region definitions
     print("\n📋 Validating region definitions...")
@@ -8,6 +8,8 @@ This script will:
 4. Show you the exact coordinates being captured
 """
 
+import ctypes
+import functools
 import os
 import sys
 import time
@@ -17,6 +19,7 @@ import numpy as np
 import pyautogui
 import win32gui
 import win32con
+from itertools import islice
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -25,16 +28,61 @@ from utils import load_yaml
 from ocr import ocr_log_text
 from window_connector import find_hwnd_by_title_substring
 
-# Same pattern as watchdog
-ENTRY_RE = re.compile(
-    r"(?P<hh>[01]?\d|2[0-3])\s*:\s*(?P<mm>[0-5]\d)\s*\|\s*(?P<msg>.*?)(?=(?:\b[01]?\d|2[0-3])\s*:\s*[0-5]\d\s*\||\Z)",
-    re.IGNORECASE | re.DOTALL,
-)
+# Timestamp-only pattern: "HH:MM |". The message is the text between one
+# timestamp's end and the next one's start — a linear scan, no lazy-.*?
+# lookahead backtracking over the whole OCR text.
+TS_RE = re.compile(r"(?<!\d)([01]?\d|2[0-3])\s*:\s*([0-5]\d)\s*\|")
+
+
+def iter_entries(text: str):
+    """Yield (hh, mm, msg) per "HH:MM | msg" entry in one pass over the matches.
+
+    Each message runs up to the next timestamp, so an entry is emitted one
+    match late — no intermediate list of all hits."""
+    prev = None
+    for m in TS_RE.finditer(text):
+        if prev is not None:
+            yield prev.group(1), prev.group(2), text[prev.end():m.start()].strip()
+        prev = m
+    if prev is not None:
+        yield prev.group(1), prev.group(2), text[prev.end():].strip()
+
+
+@functools.lru_cache(maxsize=8)
+def parse_entries(text: str) -> tuple:
+    """Memoized iter_entries(): OCR of an unchanged log returns the identical
+    string, so repeated runs skip the scan (str caches its own hash)."""
+    return tuple(iter_entries(text))
+
+
+PREVIEW_ENTRIES = 20
+
 
 def client_origin_screen(hwnd):
     return win32gui.ClientToScreen(hwnd, (0, 0))
 
 
+def display_scale_percent():
+    """Primary display scale factor in percent (100, 125, 150, 200...)."""
+    try:
+        return int(ctypes.windll.shcore.GetScaleFactorForDevice(0))  # DEVICE_PRIMARY
+    except Exception:
+        return 100
+
+
+def downsample_for_ocr(img):
+    """INTER_AREA-downsample to a 150% equivalent when scaling is above 150%.
+    Narrow regions (<800px) are left alone — they're already small."""
+    scale = display_scale_percent()
+    if scale <= 150 or img.shape[1] < 800:
+        return img
+    f = 150.0 / scale
+    out = cv2.resize(img, None, fx=f, fy=f, interpolation=cv2.INTER_AREA)
+    print(f"📉 Display scale {scale}% — downsampled {img.shape[1]}x{img.shape[0]} "
+          f"-> {out.shape[1]}x{out.shape[0]} for OCR")
+    return out
+
+
 def main():
     print("=" * 70)
     print("🔍 OCR DIAGNOSTIC TOOL")
@@ -121,6 +169,10 @@ def main():
     print(f"✅ Saved raw screenshot: logs/diagnostic_raw.png")
     print()
     
+    # On high-DPI displays (>150% scaling) the capture is oversampled far past
+    # what OCR needs — shrink it back to ~150% equivalent before preprocessing.
+    img = downsample_for_ocr(img)
+
     # Run OCR
     print("🔍 Running OCR...")
     text = ocr_log_text(img, debug_dir="logs/ocr_debug")
@@ -134,16 +186,15 @@ def main():
     
     # Test regex pattern
     print("🔍 Testing regex pattern for 'HH:MM | msg'...")
-    matches = list(ENTRY_RE.finditer(text))
-    
-    if matches:
-        print(f"✅ Found {len(matches)} matching entries:")
+    entries = parse_entries(text)
+
+    if entries:
+        print(f"✅ Found {len(entries)} matching entries:")
         print()
-        for i, m in enumerate(matches, 1):
-            hh = m.group("hh")
-            mm = m.group("mm")
-            msg = m.group("msg")[:50]  # First 50 chars
-            print(f"   Match {i}: {hh}:{mm} | {msg}...")
+        for i, (hh, mm, msg) in enumerate(islice(entries, PREVIEW_ENTRIES), 1):
+            print(f"   Match {i}: {hh}:{mm} | {msg[:50]}...")  # First 50 chars
+        if len(entries) > PREVIEW_ENTRIES:
+            print(f"   ... and {len(entries) - PREVIEW_ENTRIES} more")
     else:
         print("❌ NO MATCHES FOUND!")
         print()
@@ -8,52 +8,197 @@ This version will show you EXACTLY what's happening:
 - Multiple fallback methods
 """
 
+import atexit
 import win32gui
 import win32con
 import win32ui
-import pyautogui
-import cv2
 import numpy as np
 import time
-from ctypes import windll
+import ctypes
+from collections import OrderedDict
+
+# cv2 / mss are imported lazily: callers that only use the Windows API path
+# (capture_window_region_api) never pay their import cost. BGRA->BGR is a
+# NumPy channel slice, so the capture functions themselves don't need cv2.
+
+# Reusable BGRA scratch buffers keyed by (w, h). GetBitmapBits writes straight
+# into one of these instead of allocating a fresh bytes object per capture.
+# Only the last few sizes are kept (log box, full client, ...).
+_BGRA_BUFFERS: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+_BGRA_BUFFERS_MAX = 4
+
+
+def _bgra_buffer(w: int, h: int) -> np.ndarray:
+    key = (w, h)
+    buf = _BGRA_BUFFERS.pop(key, None)
+    if buf is None:
+        buf = np.empty((h, w, 4), dtype=np.uint8)
+    _BGRA_BUFFERS[key] = buf
+    while len(_BGRA_BUFFERS) > _BGRA_BUFFERS_MAX:
+        _BGRA_BUFFERS.popitem(last=False)
+    return buf
+
+
+_SCT = None
+
+
+def _mss():
+    """One mss session for the whole run — mss() allocates DCs on creation."""
+    global _SCT
+    if _SCT is None:
+        import mss
+        _SCT = mss.mss()
+        atexit.register(_SCT.close)
+    return _SCT
+
 
 def client_origin_screen(hwnd):
     return win32gui.ClientToScreen(hwnd, (0, 0))
 
 
-def capture_window_region_api(hwnd: int, x: int, y: int, w: int, h: int) -> np.ndarray:
-    """Windows API screenshot (works on minimized windows)."""
-    try:
+# GDI objects cached per (hwnd, w, h): the DC/bitmap create+destroy sequence
+# costs several syscalls, and the same window/region is captured repeatedly.
+# A resize changes (w, h) and so gets a fresh entry; the oldest is released.
+_GDI_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_GDI_CACHE_MAX = 4
+
+
+def _release_gdi(hwnd, objs) -> None:
+    hwndDC, mfcDC, saveDC, saveBitMap = objs
+    for release in (
+        lambda: win32gui.DeleteObject(saveBitMap.GetHandle()),
+        saveDC.DeleteDC,
+        mfcDC.DeleteDC,
+        lambda: win32gui.ReleaseDC(hwnd, hwndDC),
+    ):
+        try:
+            release()
+        except Exception:
+            pass
+
+
+def _release_all_gdi() -> None:
+    while _GDI_CACHE:
+        (hwnd, _, _), objs = _GDI_CACHE.popitem()
+        _release_gdi(hwnd, objs)
+
+
+atexit.register(_release_all_gdi)
+
+
+def _gdi_objects(hwnd: int, w: int, h: int) -> tuple:
+    key = (hwnd, w, h)
+    objs = _GDI_CACHE.pop(key, None)
+    if objs is None:
         hwndDC = win32gui.GetWindowDC(hwnd)
         mfcDC = win32ui.CreateDCFromHandle(hwndDC)
         saveDC = mfcDC.CreateCompatibleDC()
-        
+
         saveBitMap = win32ui.CreateBitmap()
         saveBitMap.CreateCompatibleBitmap(mfcDC, w, h)
         saveDC.SelectObject(saveBitMap)
-        
-        result = windll.user32.PrintWindow(hwnd, saveDC.GetSafeHdc(), 3)
-        
-        if result == 0:
-            saveDC.BitBlt((0, 0), (w, h), mfcDC, (x, y), win32con.SRCCOPY)
-        else:
-            saveDC.BitBlt((0, 0), (w, h), mfcDC, (x, y), win32con.SRCCOPY)
-        
-        bmpstr = saveBitMap.GetBitmapBits(True)
-        img = np.frombuffer(bmpstr, dtype=np.uint8)
-        img.shape = (h, w, 4)
-        
-        win32gui.DeleteObject(saveBitMap.GetHandle())
-        saveDC.DeleteDC()
-        mfcDC.DeleteDC()
-        win32gui.ReleaseDC(hwnd, hwndDC)
-        
-        return cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+        objs = (hwndDC, mfcDC, saveDC, saveBitMap)
+    _GDI_CACHE[key] = objs
+    while len(_GDI_CACHE) > _GDI_CACHE_MAX:
+        (old_hwnd, _, _), old = _GDI_CACHE.popitem(last=False)
+        _release_gdi(old_hwnd, old)
+    return objs
+
+
+def capture_window_region_api(hwnd: int, x: int, y: int, w: int, h: int) -> np.ndarray:
+    """Windows API screenshot (BitBlt of the region from the window DC)."""
+    try:
+        _, mfcDC, saveDC, saveBitMap = _gdi_objects(hwnd, w, h)
+
+        # One blit per capture. PrintWindow used to run first, but it renders
+        # the window's top-left corner (not the x,y region) and BitBlt always
+        # overwrote it, so it was pure wasted GDI work.
+        saveDC.BitBlt((0, 0), (w, h), mfcDC, (x, y), win32con.SRCCOPY)
+
+        img = _bgra_buffer(w, h)
+        copied = ctypes.windll.gdi32.GetBitmapBits(
+            ctypes.c_void_p(saveBitMap.GetHandle()),
+            img.nbytes,
+            img.ctypes.data_as(ctypes.c_void_p),
+        )
+        if copied != img.nbytes:
+            raise OSError(f"GetBitmapBits copied {copied}/{img.nbytes} bytes")
+
+        # The BGR result is a fresh contiguous copy, so callers never hold a
+        # view into the shared scratch buffer.
+        return np.ascontiguousarray(img[:, :, :3])
     except Exception as e:
+        # Don't reuse objects that just failed — release and recreate next call.
+        objs = _GDI_CACHE.pop((hwnd, w, h), None)
+        if objs is not None:
+            _release_gdi(hwnd, objs)
         print(f"⚠️  Windows API capture failed: {e}")
         return None
 
 
+def _sample_mean(img: np.ndarray) -> float:
+    """Mean brightness over a ~64x64 strided grid (a view, no copy).
+
+    Only used for the "is it all black?" check — a full-array mean reads every
+    byte of the capture just to compare against a threshold. The stride scales
+    with the image so a thin log strip still gets every row sampled."""
+    h, w = img.shape[:2]
+    return float(img[::max(1, h // 64), ::max(1, w // 64)].mean())
+
+
+# Client geometry (cx, cy, client_w, client_h) per hwnd. Re-queried at most
+# every _GEOM_RECHECK_S, or right after we restore/show the window.
+_GEOM_CACHE: dict = {}
+_GEOM_RECHECK_S = 2.0
+
+
+def client_geometry(hwnd: int) -> tuple:
+    now = time.monotonic()
+    hit = _GEOM_CACHE.get(hwnd)
+    if hit is not None and now - hit[0] < _GEOM_RECHECK_S:
+        return hit[1]
+    cl, ct, cr, cb = win32gui.GetClientRect(hwnd)
+    cx, cy = client_origin_screen(hwnd)
+    geom = (cx, cy, cr - cl, cb - ct)
+    _GEOM_CACHE[hwnd] = (now, geom)
+    return geom
+
+
+def _probe_window(hwnd: int) -> bool:
+    """Print window state diagnostics. Returns True if the window is minimized."""
+    is_visible = win32gui.IsWindowVisible(hwnd)
+    is_iconic = win32gui.IsIconic(hwnd)  # Minimized?
+
+    print(f"Window state:")
+    print(f"  HWND: {hwnd}")
+    print(f"  Visible: {is_visible}")
+    print(f"  Minimized: {is_iconic}")
+
+    # Get window position
+    left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+    print(f"  Window rect: ({left}, {top}) to ({right}, {bottom})")
+    print(f"  Window size: {right-left} x {bottom-top}")
+    return bool(is_iconic)
+
+
+def capture_logbox_client_fast(hwnd: int, log_region: dict) -> np.ndarray:
+    """Hot path: API blit, then mss grab at the cached client origin.
+    No diagnostics, no focus changes. Returns None if both come back black."""
+    x = int(log_region["x"])
+    y = int(log_region["y"])
+    w = int(log_region["w"])
+    h = int(log_region["h"])
+
+    img = capture_window_region_api(hwnd, x, y, w, h)
+    if img is not None and _sample_mean(img) > 5:
+        return img
+
+    cx, cy, _, _ = client_geometry(hwnd)
+    shot = _mss().grab({"left": cx + x, "top": cy + y, "width": w, "height": h})
+    img = np.ascontiguousarray(np.asarray(shot)[:, :, :3])
+    return img if _sample_mean(img) > 5 else None
+
+
 def capture_logbox_client_BULLETPROOF(hwnd: int, log_region: dict) -> np.ndarray:
     """
     BULLETPROOF capture with extensive debugging and multiple fallbacks.
@@ -69,23 +214,10 @@ def capture_logbox_client_BULLETPROOF(hwnd: int, log_region: dict) -> np.ndarray
     
     # 1. Check window state
     try:
-        is_visible = win32gui.IsWindowVisible(hwnd)
-        is_iconic = win32gui.IsIconic(hwnd)  # Minimized?
-        
-        print(f"Window state:")
-        print(f"  HWND: {hwnd}")
-        print(f"  Visible: {is_visible}")
-        print(f"  Minimized: {is_iconic}")
-        
-        # Get window position
-        left, top, right, bottom = win32gui.GetWindowRect(hwnd)
-        print(f"  Window rect: ({left}, {top}) to ({right}, {bottom})")
-        print(f"  Window size: {right-left} x {bottom-top}")
+        is_iconic = _probe_window(hwnd)
         
         # Get client area
-        cl, ct, cr, cb = win32gui.GetClientRect(hwnd)
-        client_w = cr - cl
-        client_h = cb - ct
+        _, _, client_w, client_h = client_geometry(hwnd)
         print(f"  Client size: {client_w} x {client_h}")
         
     except Exception as e:
@@ -95,29 +227,34 @@ def capture_logbox_client_BULLETPROOF(hwnd: int, log_region: dict) -> np.ndarray
     # 2. FORCE window to be visible and focused
     print("\n🎯 Forcing window to foreground...")
     try:
-        # Restore if minimized
-        if is_iconic:
-            print("   Window was minimized, restoring...")
-            win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-            time.sleep(0.5)
-        
-        # Show and focus
-        win32gui.ShowWindow(hwnd, win32con.SW_SHOW)
-        win32gui.SetForegroundWindow(hwnd)
-        time.sleep(0.5)
-        
-        # Verify focus
-        fg = win32gui.GetForegroundWindow()
-        if fg == hwnd:
-            print("   ✅ Window is now in foreground")
+        if not is_iconic and win32gui.GetForegroundWindow() == hwnd:
+            print("   ✅ Window already in foreground")
         else:
-            print(f"   ⚠️  Window not in foreground (fg={fg})")
+            # Restore if minimized
+            if is_iconic:
+                print("   Window was minimized, restoring...")
+                win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+                time.sleep(0.5)
+
+            # Show and focus
+            win32gui.ShowWindow(hwnd, win32con.SW_SHOW)
+            win32gui.SetForegroundWindow(hwnd)
+            time.sleep(0.5)
+            # Restoring can move the client area — re-query geometry below
+            _GEOM_CACHE.pop(hwnd, None)
+
+            # Verify focus
+            fg = win32gui.GetForegroundWindow()
+            if fg == hwnd:
+                print("   ✅ Window is now in foreground")
+            else:
+                print(f"   ⚠️  Window not in foreground (fg={fg})")
         
     except Exception as e:
         print(f"   ⚠️  Focus failed: {e}")
     
     # 3. Calculate screen coordinates
-    cx, cy = client_origin_screen(hwnd)
+    cx, cy, client_w, client_h = client_geometry(hwnd)
     screen_x = cx + x
     screen_y = cy + y
     
@@ -146,7 +283,7 @@ def capture_logbox_client_BULLETPROOF(hwnd: int, log_region: dict) -> np.ndarray
     img = capture_window_region_api(hwnd, x, y, w, h)
     if img is not None:
         # Check if image is not all black
-        mean_val = img.mean()
+        mean_val = _sample_mean(img)
         if mean_val > 5:  # Not completely black
             print(f"   ✅ Success! (mean pixel value: {mean_val:.1f})")
             print("=" * 70 + "\n")
@@ -156,17 +293,18 @@ def capture_logbox_client_BULLETPROOF(hwnd: int, log_region: dict) -> np.ndarray
     else:
         print("   ❌ Failed")
     
-    # METHOD 2: pyautogui with forced focus
-    print("\n🔍 Method 2: pyautogui screenshot (after focus)...")
+    # METHOD 2: mss screen grab with forced focus
+    print("\n🔍 Method 2: mss screenshot (after focus)...")
     try:
         # Extra focus attempt
-        win32gui.SetForegroundWindow(hwnd)
-        time.sleep(0.3)
+        if win32gui.GetForegroundWindow() != hwnd:
+            win32gui.SetForegroundWindow(hwnd)
+            time.sleep(0.3)
         
-        shot = pyautogui.screenshot(region=(screen_x, screen_y, w, h))
-        img = cv2.cvtColor(np.array(shot), cv2.COLOR_RGB2BGR)
+        shot = _mss().grab({"left": screen_x, "top": screen_y, "width": w, "height": h})
+        img = np.ascontiguousarray(np.asarray(shot)[:, :, :3])
         
-        mean_val = img.mean()
+        mean_val = _sample_mean(img)
         if mean_val > 5:
             print(f"   ✅ Success! (mean pixel value: {mean_val:.1f})")
             print("=" * 70 + "\n")
@@ -184,7 +322,7 @@ def capture_logbox_client_BULLETPROOF(hwnd: int, log_region: dict) -> np.ndarray
         if full_img is not None:
             # Crop to log region
             img = full_img[y:y+h, x:x+w]
-            mean_val = img.mean()
+            mean_val = _sample_mean(img)
             if mean_val > 5:
                 print(f"   ✅ Success! (mean pixel value: {mean_val:.1f})")
                 print("=" * 70 + "\n")
@@ -240,8 +378,10 @@ if __name__ == "__main__":
     
     # Save result
     import os
+    import cv2
     os.makedirs("logs", exist_ok=True)
-    cv2.imwrite("logs/debug_capture.png", img)
+    # Fastest deflate level: this is a throwaway diagnostic image
+    cv2.imwrite("logs/debug_capture.png", img, [cv2.IMWRITE_PNG_COMPRESSION, 1])
     print(f"\n💾 Saved to: logs/debug_capture.png")
     print(f"   Image size: {img.shape}")
     print(f"   Mean pixel: {img.mean():.1f}")
@@ -0,0 +1,46 @@
+"""Unit tests for src/log_parse.py (pure logic — runs anywhere)."""
+import sys, unittest
+from pathlib import Path
+from unittest import mock
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import log_parse
+from log_parse import minutes_since_hhmm, find_latest_entry
+
+class TestMinutesSinceHhmm(unittest.TestCase):
+    def test_same_day(self):
+        # 10:30 now, entry at 10:00
+        self.assertEqual(minutes_since_hhmm(10, 0, now_min=630.0), 30)
+    def test_exactly_now_is_zero(self):
+        self.assertEqual(minutes_since_hhmm(10, 30, now_min=630.0), 0)
+    def test_wraps_past_midnight(self):
+        # 00:10 now, entry at 23:50 -> yesterday, 20 minutes ago
+        self.assertEqual(minutes_since_hhmm(23, 50, now_min=10.0), 20)
+    def test_later_today_means_yesterday(self):
+        self.assertEqual(minutes_since_hhmm(10, 1, now_min=600.0), 24 * 60 - 1)
+    def test_out_of_range_raises(self):
+        for hh, mm in ((24, 0), (25, 10), (29, 59), (-1, 0), (12, 60), (0, -1)):
+            with self.assertRaises(ValueError, msg=f"{hh}:{mm}"):
+                minutes_since_hhmm(hh, mm, now_min=0.0)
+
+class TestParseEntries(unittest.TestCase):
+    def setUp(self):
+        log_parse._parse_cache = (None, ())
+        # pin "now" to 12:00 so find_latest_entry's scores are deterministic
+        patcher = mock.patch.object(log_parse, "_now_minute_of_day", return_value=12 * 60.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    def test_out_of_range_hour_skipped(self):
+        self.assertEqual(log_parse._parse_entries("25:10 | msg"), ())
+    def test_out_of_range_hour_skipped_among_valid(self):
+        self.assertEqual(log_parse._parse_entries("11:50 | farming 25:10 | garbled"),
+                         ((11, 50, "farming"),))
+    def test_find_latest_entry_ignores_bad_hour(self):
+        self.assertEqual(find_latest_entry("25:10 | msg"), (None,) * 5)
+        self.assertEqual(find_latest_entry("25:10 | msg 11:45 | warm up"),
+                         (15.0, 11, 45, "11:45 | warm up", "warm up"))
+    def test_find_latest_entry_picks_closest_to_now(self):
+        mins, hh, mm, _, _ = find_latest_entry("09:00 | old 11:58 | new 11:30 | mid")
+        self.assertEqual((mins, hh, mm), (2.0, 11, 58))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,13 +1,12 @@
+import atexit
 import win32gui
 import mss
 import numpy as np
 import cv2
-import pytesseract
 import os
 import win32con
 import ctypes
 from ctypes import wintypes
-import pyautogui
 import time
 from ocr import ocr_log_text
 
@@ -16,11 +15,27 @@ from ocr import ocr_log_text
 from utils import load_yaml, setup_logger
 from window_connector import find_hwnd_by_title_substring
 
+# Diagnostic PNGs: fastest deflate level — encodes several times faster
+# than the default (3) for somewhat larger files.
+PNG_FAST = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+
 APP_CFG_PATH = "config/app.yaml"
 REGIONS_CFG_PATH = "config/regions.yaml"
 
-# 👉 Change this only if Tesseract is installed elsewhere
-pytesseract.pytesseract.tesseract_cmd = r"C:\Users\Recruiter\Tesseract-OCR\tesseract.exe"
+# OCR goes through ocr.ocr_log_text: bundled third_party/Tesseract-OCR, run
+# in-process via tesserocr when it's installed (pytesseract otherwise).
+
+_SCT = None
+
+
+def _mss():
+    """One mss session for the whole run — mss() allocates DCs on creation."""
+    global _SCT
+    if _SCT is None:
+        _SCT = mss.mss()
+        atexit.register(_SCT.close)
+    return _SCT
+
 
 def client_origin_screen(hwnd):
     point = wintypes.POINT(0, 0)
@@ -77,33 +92,36 @@ def main():
 
     os.makedirs("logs", exist_ok=True)
 
-    # Full screen capture (always reliable)
-    full = pyautogui.screenshot()
-    full_bgr = cv2.cvtColor(np.array(full), cv2.COLOR_RGB2BGR)
-
     # Rectangle where we THINK the logbox is
     x = int(capture_region["left"])
     y = int(capture_region["top"])
     w = int(capture_region["width"])
     h = int(capture_region["height"])
 
-    # Save a debug image with a green rectangle drawn on the full screen
-    debug = full_bgr.copy()
-    cv2.rectangle(debug, (x, y), (x + w, y + h), (0, 255, 0), 2)
-    cv2.imwrite("logs/full_debug.png", debug)
-    print("Saved full debug image to logs/full_debug.png")
-
-    # Crop safely (clamp to screen bounds)
-    H, W = full_bgr.shape[:2]
-    x1 = max(0, x)
-    y1 = max(0, y)
-    x2 = min(W, x + w)
-    y2 = min(H, y + h)
-
-    img = full_bgr[y1:y2, x1:x2]
-
-
-    cv2.imwrite("logs/raw_capture.png", img)
+    sct = _mss()
+    # Clamp to the virtual screen so the crop matches what's on screen
+    vs = sct.monitors[0]
+    x1 = max(vs["left"], x)
+    y1 = max(vs["top"], y)
+    x2 = min(vs["left"] + vs["width"], x + w)
+    y2 = min(vs["top"] + vs["height"], y + h)
+    if x2 <= x1 or y2 <= y1:
+        raise SystemExit(f"Capture region is off-screen: {capture_region}")
+
+    # Grab only the logbox instead of the whole desktop
+    shot = sct.grab({"left": x1, "top": y1, "width": x2 - x1, "height": y2 - y1})
+    img = np.ascontiguousarray(np.asarray(shot)[:, :, :3])
+
+    if os.environ.get("OCR_DEBUG"):
+        # Full-screen shot with the region drawn on it (debug only)
+        full_bgr = np.ascontiguousarray(np.asarray(sct.grab(vs))[:, :, :3])
+        ox, oy = x - vs["left"], y - vs["top"]
+        cv2.rectangle(full_bgr, (ox, oy), (ox + w, oy + h), (0, 255, 0), 2)
+        cv2.imwrite("logs/full_debug.png", full_bgr, PNG_FAST)
+        print("Saved full debug image to logs/full_debug.png")
+
+
+    cv2.imwrite("logs/raw_capture.png", img, PNG_FAST)
     print("Saved raw capture to logs/raw_capture.png")
     print("mean pixel:", img.mean(), "min:", img.min(), "max:", img.max())
 
@@ -4,12 +4,17 @@ Test script to diagnose why panel .exe is not being found
 Run this to see exactly what's happening with your panel directory
 """
 import os
+import sys
+from itertools import islice
 from pathlib import Path
-import yaml
 
-def load_yaml(path):
-    with open(path, 'r') as f:
-        return yaml.safe_load(f)
+# Use the app's own loader (JSON sidecar, encoding fallbacks) from src/
+_SRC = Path(__file__).resolve().parent.parent / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+from utils import load_yaml
+
 
 def test_panel_finding():
     print("="*70)
@@ -70,33 +75,38 @@ def test_panel_finding():
     
     print(f"   ✅ Directory exists!")
     
-    # List all files
+    # List all files — one os.scandir pass collects everything steps 4-5 need
     print("\n4️⃣ Listing all files in directory...")
-    all_files = list(d.iterdir())
-    
-    if not all_files:
+    all_entries = []
+    exes = []
+    with os.scandir(d) as it:
+        for e in it:
+            all_entries.append(e)
+            if e.is_file() and e.name.lower().endswith(".exe"):
+                exes.append(e)
+    
+    if not all_entries:
         print("   ⚠️  Directory is empty!")
         return
     
-    print(f"   Found {len(all_files)} item(s):")
-    for item in all_files[:10]:  # Show first 10
+    print(f"   Found {len(all_entries)} item(s):")
+    for item in islice(all_entries, 10):  # Show first 10
         if item.is_file():
             size_mb = item.stat().st_size / (1024 * 1024)
             print(f"      📄 {item.name} ({size_mb:.1f} MB)")
         else:
             print(f"      📁 {item.name}/")
     
-    if len(all_files) > 10:
-        print(f"      ... and {len(all_files) - 10} more")
+    if len(all_entries) > 10:
+        print(f"      ... and {len(all_entries) - 10} more")
     
     # Find .exe files
     print("\n5️⃣ Searching for .exe files...")
-    exes = list(d.glob("*.exe"))
-    
+
     if not exes:
         print("   ❌ No .exe files found!")
         print("\n   Files with other extensions:")
-        for item in d.iterdir():
+        for item in all_entries:
             if item.is_file():
                 print(f"      {item.name}")
         return
@@ -104,28 +114,29 @@ def test_panel_finding():
     print(f"   ✅ Found {len(exes)} .exe file(s):")
     
     # Sort by modification time (newest first)
-    exes.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    
+    exes.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+
     from datetime import datetime
-    
+
     for i, exe in enumerate(exes, 1):
-        mtime = datetime.fromtimestamp(exe.stat().st_mtime)
-        size_mb = exe.stat().st_size / (1024 * 1024)
+        st = exe.stat()
+        mtime = datetime.fromtimestamp(st.st_mtime)
+        size_mb = st.st_size / (1024 * 1024)
         marker = "⭐ [NEWEST]" if i == 1 else "  "
         print(f"      {marker} {exe.name}")
         print(f"         Modified: {mtime.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"         Size: {size_mb:.1f} MB")
-        print(f"         Full path: {exe}")
-    
+        print(f"         Full path: {exe.path}")
+
     # Show what would be launched
     print("\n6️⃣ Result:")
     newest = exes[0]
     print(f"   ✅ Would launch: {newest.name}")
-    print(f"   📍 Full path: {newest}")
+    print(f"   📍 Full path: {newest.path}")
     
     # Test if file is actually executable
     print("\n7️⃣ Checking if file is accessible...")
-    if os.access(str(newest), os.X_OK):
+    if os.access(newest.path, os.X_OK):
         print("   ✅ File has execute permissions")
     else:
         print("   ⚠️  File might not be executable (could be normal on Windows)")
@@ -136,7 +147,7 @@ def test_panel_finding():
     
     if exes:
         print(f"\n🎯 SUCCESS: Found panel exe: {newest.name}")
-        print(f"   The watchdog will launch: {newest}")
+        print(f"   The watchdog will launch: {newest.path}")
     else:
         print("\n❌ PROBLEM: No .exe files found")
         print("   Check the directory path in regions.yaml")
@@ -0,0 +1,99 @@
+"""Unit tests for utils.load_yaml's caching and decoding.
+
+Covers the (mtime_ns, size) cache key — in-process lru_cache and the JSON
+sidecar next to the config — the round-trip guard that keeps configs JSON
+can't represent (int keys, dates) out of the sidecar, and the cp1252
+fallback for configs saved by Notepad/Wordpad.
+
+utils imports only stdlib + PyYAML, so this runs under a plain python3 on
+any OS:
+
+    python3 "Test files/test_yaml_cache.py"
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+if str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+import utils  # noqa: E402
+
+
+class TestLoadYamlCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "app.yaml")
+        self.sidecar = self.path + ".cache.json"
+        utils._load_yaml_cached.cache_clear()
+
+    def tearDown(self):
+        utils._load_yaml_cached.cache_clear()
+        self._tmp.cleanup()
+
+    def _write(self, data: bytes) -> None:
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+    def test_writes_sidecar_keyed_on_mtime_and_size(self):
+        self._write(b"watchdog:\n  poll_seconds: 180\n")
+        self.assertEqual(utils.load_yaml(self.path), {"watchdog": {"poll_seconds": 180}})
+        st = os.stat(self.path)
+        with open(self.sidecar, encoding="utf-8") as f:
+            cached = json.load(f)
+        self.assertEqual(cached["key"], [st.st_mtime_ns, st.st_size])
+        self.assertEqual(cached["data"], {"watchdog": {"poll_seconds": 180}})
+
+    def test_matching_sidecar_skips_the_parse(self):
+        self._write(b"a: 1\n")
+        st = os.stat(self.path)
+        with open(self.sidecar, "w", encoding="utf-8") as f:
+            json.dump({"key": [st.st_mtime_ns, st.st_size], "data": {"a": "from-sidecar"}}, f)
+        self.assertEqual(utils.load_yaml(self.path), {"a": "from-sidecar"})
+
+    def test_key_change_reparses(self):
+        self._write(b"a: 1\n")
+        self.assertEqual(utils.load_yaml(self.path), {"a": 1})
+        # Different size, so the key changes even on coarse-mtime filesystems.
+        self._write(b"a: 22222\n")
+        self.assertEqual(utils.load_yaml(self.path), {"a": 22222})
+        with open(self.sidecar, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["data"], {"a": 22222})
+
+    def test_non_json_safe_config_writes_no_sidecar(self):
+        # JSON would turn the int key into a string and has no date type
+        self._write(b"1: one\nwhen: 2024-01-02\n")
+        data = utils.load_yaml(self.path)
+        self.assertEqual(data[1], "one")
+        self.assertFalse(os.path.exists(self.sidecar))
+        self.assertEqual(
+            [n for n in os.listdir(self._tmp.name) if n.endswith(".tmp")], []
+        )
+
+    def test_cp1252_file_decodes(self):
+        self._write("title: café – panel\n".encode("cp1252"))
+        self.assertEqual(utils.load_yaml(self.path), {"title": "café – panel"})
+
+    def test_editable_copy_added_later_wins_over_bundled(self):
+        exe = os.path.join(self._tmp.name, "exe")
+        bundled = os.path.join(self._tmp.name, "bundled")
+        for d in (exe, bundled):
+            os.makedirs(os.path.join(d, "config"))
+        with open(os.path.join(bundled, "config", "app.yaml"), "wb") as f:
+            f.write(b"src: bundled\n")
+        with mock.patch.object(utils, "exe_dir", return_value=exe), \
+             mock.patch.object(utils, "runtime_root", return_value=bundled):
+            self.assertEqual(utils.load_yaml("config/app.yaml"), {"src": "bundled"})
+            # a long-running process must see the editable copy once it appears
+            with open(os.path.join(exe, "config", "app.yaml"), "wb") as f:
+                f.write(b"src: editable\n")
+            self.assertEqual(utils.load_yaml("config/app.yaml"), {"src": "editable"})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -5,8 +5,6 @@ import traceback
 import time
 from datetime import datetime
 
-from steps.memreduct import run as mem_run
-from steps.rdp import run as rdp_run
 from utils import load_yaml, exe_dir
 from auto_updater import check_updates
 from heartbeat import write_heartbeat
@@ -59,6 +57,13 @@ def main():
     # Check for Boot.exe update on startup
     check_boot_update(log)
 
+    # Step modules pull in pywinauto / pyautogui / win32 at import time. Import
+    # them only after the update check, so a pending update applies (and exits)
+    # without paying that cold-start cost. Plain import statements (not
+    # importlib strings) so PyInstaller still bundles them.
+    from steps.memreduct import run as mem_run
+    from steps.rdp import run as rdp_run
+
     try:
         cfg = load_yaml("config/regions.yaml")
         log.info("Config loaded")
@@ -13,29 +13,57 @@ Features:
 
 import time
 import ctypes
+from ctypes import wintypes
 import win32gui
 import win32con
-import pyautogui
 import sys
 
-def set_dpi_awareness():
-    """Set DPI awareness to get accurate pixel coordinates."""
-    try:
-        # Per-monitor v2 (best)
-        ctypes.windll.user32.SetProcessDpiAwarenessContext(ctypes.c_void_p(-4))
-        return "Per-monitor v2"
-    except Exception:
-        try:
-            # Per-monitor (Win 8.1+)
-            ctypes.windll.shcore.SetProcessDpiAwareness(2)
-            return "Per-monitor"
-        except Exception:
-            try:
-                # System DPI aware (legacy)
-                ctypes.windll.user32.SetProcessDPIAware()
-                return "System DPI"
-            except Exception:
-                return "None (might have issues)"
+from winops import set_dpi_awareness
+
+# Cursor is read/moved straight through user32: pyautogui adds a ~100 ms
+# PAUSE plus Python-side overhead to every call, which made the live
+# countdown readout and the test-point move noticeably laggy.
+_user32 = ctypes.WinDLL("user32")  # private handle: argtypes below stay local
+_user32.GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+_user32.SetCursorPos.argtypes = [ctypes.c_int, ctypes.c_int]
+_cursor_pt = wintypes.POINT()
+
+def cursor_pos():
+    """Current mouse position in screen coordinates."""
+    _user32.GetCursorPos(ctypes.byref(_cursor_pt))
+    return _cursor_pt.x, _cursor_pt.y
+
+def move_cursor(x, y, duration=0.0, steps=25):
+    """Move the mouse to (x, y), optionally animated over `duration` seconds."""
+    if duration > 0:
+        sx, sy = cursor_pos()
+        for i in range(1, steps):
+            _user32.SetCursorPos(sx + (x - sx) * i // steps, sy + (y - sy) * i // steps)
+            time.sleep(duration / steps)
+    _user32.SetCursorPos(int(x), int(y))
+
+# Client geometry (cw, ch, cx, cy) per HWND for this calibration session.
+# The window isn't expected to move while calibrating; 'g' in the menu
+# forces a re-read if it does.
+_geom_cache = {}
+
+def refresh_geom(hwnd):
+    """Re-read the client size and screen origin of hwnd and cache it."""
+    # Get client area dimensions
+    cl, ct, cr, cb = win32gui.GetClientRect(hwnd)
+    cw = cr - cl
+    ch = cb - ct
+    
+    # Get client area origin in screen coordinates
+    cx, cy = win32gui.ClientToScreen(hwnd, (0, 0))
+    
+    _geom_cache[hwnd] = (cw, ch, cx, cy)
+    return _geom_cache[hwnd]
+
+def get_geom(hwnd):
+    """Cached client geometry of hwnd (reads it on first use)."""
+    geom = _geom_cache.get(hwnd)
+    return geom if geom is not None else refresh_geom(hwnd)
 
 def get_active_window():
     """Get the currently focused window and its dimensions."""
@@ -46,32 +74,37 @@ def get_active_window():
     # Get window title for confirmation
     title = win32gui.GetWindowText(hwnd)
     
-    # Get client area dimensions
-    cl, ct, cr, cb = win32gui.GetClientRect(hwnd)
-    cw = cr - cl
-    ch = cb - ct
-    
-    # Get client area origin in screen coordinates
-    cx, cy = win32gui.ClientToScreen(hwnd, (0, 0))
-    
+    cw, ch, cx, cy = refresh_geom(hwnd)
     return hwnd, cw, ch, cx, cy, title
 
+# Fixed-width so a shorter line fully overwrites the previous one after \r
+_COUNTDOWN_TMPL = "  %ds...\r"
+_COUNTDOWN_MOUSE_TMPL = "  %ds... (mouse at screen: %5d, %5d)\r"
+
 def countdown(msg, s=3, show_mouse=True):
     """Countdown with optional mouse position display."""
     print(f"\n{msg}")
-    for i in range(s, 0, -1):
-        if show_mouse:
-            mx, my = pyautogui.position()
-            print(f"  {i}s... (mouse at screen: {mx}, {my})", end='\r')
-        else:
-            print(f"  {i}s...", end='\r')
-        time.sleep(1)
+    # Deadline loop: the readout follows the mouse at ~30 Hz and the total
+    # doesn't drift by the cost of each print. Only redraw on change.
+    tmpl = _COUNTDOWN_MOUSE_TMPL if show_mouse else _COUNTDOWN_TMPL
+    deadline = time.monotonic() + s
+    last = None
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        state = (int(remaining) + 1,) + (cursor_pos() if show_mouse else ())
+        if state != last:
+            last = state
+            sys.stdout.write(tmpl % state)
+            sys.stdout.flush()
+        time.sleep(min(0.033, remaining))
     print()  # New line after countdown
 
 def calibrate_point(cw, ch, cx, cy):
     """Calibrate a single point and return percentage coordinates."""
     countdown("🎯 Move mouse to TARGET POINT", 3, show_mouse=True)
-    mx, my = pyautogui.position()
+    mx, my = cursor_pos()
     
     # Calculate percentage
     x_pct = (mx - cx) / cw
@@ -98,10 +131,10 @@ def calibrate_point(cw, ch, cx, cy):
 def calibrate_region(cw, ch, cx, cy):
     """Calibrate a rectangular region and return percentage coordinates."""
     countdown("📍 Move mouse to TOP-LEFT corner", 3, show_mouse=True)
-    tlx, tly = pyautogui.position()
+    tlx, tly = cursor_pos()
     
     countdown("📍 Move mouse to BOTTOM-RIGHT corner", 3, show_mouse=True)
-    brx, bry = pyautogui.position()
+    brx, bry = cursor_pos()
     
     # Calculate region
     x = min(tlx, brx) - cx
@@ -152,7 +185,7 @@ def test_point(hwnd, cw, ch, cx, cy, x_pct, y_pct):
     countdown("Moving mouse to calculated position", 2, show_mouse=False)
     
     # Move to the point (with smooth animation)
-    pyautogui.moveTo(screen_x, screen_y, duration=0.5)
+    move_cursor(screen_x, screen_y, duration=0.5)
     
     print(f"   ✅ Mouse moved to ({screen_x}, {screen_y})")
     print(f"   👀 Check if this is the correct position!")
@@ -227,6 +260,7 @@ def main():
         print("  r = Calibrate REGION (for OCR detection)")
         print("  t = TEST existing coordinates")
         print("  m = Calibrate MULTIPLE points (for first-run sequence)")
+        print("  g = Re-read window GEOMETRY (after moving/resizing it)")
         print("  q = QUIT")
         print("="*70)
         
@@ -236,6 +270,14 @@ def main():
             print("👋 Goodbye!")
             break
         
+        elif mode == 'g':
+            try:
+                cw, ch, cx, cy = refresh_geom(hwnd)
+            except Exception as e:
+                print(f"❌ Could not read window geometry: {e}")
+                continue
+            print(f"✅ Client size: {cw}x{ch}, origin: ({cx}, {cy})")
+        
         elif mode == 'p':
             # Single point calibration
             result = calibrate_point(cw, ch, cx, cy)
@@ -277,6 +319,8 @@ def main():
                 print("❌ Invalid number")
                 continue
             
+            # One geometry read for the whole sequence, not one per click
+            cw, ch, cx, cy = get_geom(hwnd)
             clicks = []
             for i in range(1, num_clicks + 1):
                 print(f"\n--- Click {i}/{num_clicks} ---")
@@ -311,7 +355,7 @@ def main():
                     test_point(hwnd, cw, ch, cx, cy, click['x_pct'], click['y_pct'])
         
         else:
-            print("❌ Invalid option. Please choose p, r, t, m, or q")
+            print("❌ Invalid option. Please choose p, r, t, m, g, or q")
 
 if __name__ == "__main__":
     try:
@@ -45,7 +45,8 @@ def _tasklist_count(image, username=None):
         cmd += ["/FI", f"USERNAME eq {username}"]
     try:
         out = subprocess.check_output(cmd, text=True, errors="ignore", timeout=15)
-        return sum(1 for line in out.splitlines() if image.lower() in line.lower())
+        needle = image.lower()
+        return sum(1 for line in out.splitlines() if needle in line.lower())
     except Exception:
         return 0
 
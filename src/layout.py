@@ -1,15 +1,36 @@
+import ctypes
+import time
+from ctypes import wintypes
+
 import win32gui
 import win32con
-import win32api
 import pywintypes
 
-def get_workarea_rect():
-    hmon = win32api.MonitorFromPoint((0, 0), win32con.MONITOR_DEFAULTTOPRIMARY)
-    info = win32api.GetMonitorInfo(hmon)
-    return info["Work"]  # (left, top, right, bottom)
+SPI_GETWORKAREA = 0x0030
+
+# Primary work area only changes on resolution/taskbar changes; re-read it
+# at most every few seconds instead of on every window move.
+_WORKAREA_TTL_S = 5.0
+_workarea_cache = None  # (monotonic timestamp, (left, top, right, bottom))
+
+def get_workarea_rect(max_age_s: float = _WORKAREA_TTL_S):
+    global _workarea_cache
+    now = time.monotonic()
+    if _workarea_cache is not None and now - _workarea_cache[0] < max_age_s:
+        return _workarea_cache[1]
+    rect = wintypes.RECT()
+    if not ctypes.windll.user32.SystemParametersInfoW(SPI_GETWORKAREA, 0, ctypes.byref(rect), 0):
+        raise ctypes.WinError()
+    wa = (rect.left, rect.top, rect.right, rect.bottom)
+    _workarea_cache = (now, wa)
+    return wa  # (left, top, right, bottom)
 
 def normalize_window_bottom_right(hwnd: int, width: int, height: int, margin_right=0, margin_bottom=0):
-    win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+    # Called every poll: restore only when needed, and skip MoveWindow (a
+    # WM_WINDOWPOS* round trip plus repaint) when the window is already there.
+    if (not win32gui.IsWindowVisible(hwnd) or win32gui.IsIconic(hwnd)
+            or win32gui.GetWindowPlacement(hwnd)[1] == win32con.SW_SHOWMAXIMIZED):
+        win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
 
     wa_left, wa_top, wa_right, wa_bottom = get_workarea_rect()
 
@@ -18,6 +39,10 @@ def normalize_window_bottom_right(hwnd: int, width: int, height: int, margin_rig
     x = (wa_right - width) - margin_right
     y = (wa_bottom - height) - margin_bottom
 
+    if (abs(left - x) <= 1 and abs(top - y) <= 1
+            and abs((right - left) - width) <= 1 and abs((bottom - top) - height) <= 1):
+        return left, top, False
+
     try:
         win32gui.MoveWindow(hwnd, x, y, width, height, True)
         return x, y, True
@@ -0,0 +1,160 @@
+"""Logbox OCR text -> latest "HH:MM | message" entry. NO win32 imports — unit-testable anywhere.
+
+watchdog.py scores the panel log with find_latest_entry; the timestamp
+parsing and "minutes ago" math live here so they are tested as-is."""
+import re
+from datetime import datetime
+from typing import Optional, Tuple
+
+# Matches log entries in the format "HH:MM | message"
+# Requires a pipe (or OCR variant) after the timestamp to avoid matching random numbers in messages
+ENTRY_RE = re.compile(
+    r"(?P<hh>[012]?\d)\s*:\s*(?P<mm>[0-5]\d)\s*[|\u00a6\uff5c\u4e28Il]\s*(?P<msg>.+?)(?=(?:[012]?\d)\s*:\s*[0-5]\d\s*[|\u00a6\uff5c\u4e28Il]|\Z)",
+    re.DOTALL,
+)
+
+# Pattern for "warm up"
+WARM_WORD_RE = re.compile(r"\bwarm[\s\-]*up\b", re.IGNORECASE)
+
+# normalize_* helpers run on every poll's OCR text — compile once here
+# instead of going through re's pattern cache on each call.
+_WS_RE = re.compile(r"\s+")
+# OCR reads colon as period — only fix when followed by pipe (actual timestamp, not random N.N in messages)
+_DOT_TS_RE = re.compile(r"\b(\d{1,2})\.(\d{2})\s*([|\u00a6\uff5c\u4e28Il])")
+_I_PIPE_RE = re.compile(r"(\d{1,2}:\d{1,2})\s*I\s+")
+_L_PIPE_RE = re.compile(r"(\d{1,2}:\d{1,2})\s+l\s+")
+# Pipe-like characters -> "|" in one C-level pass:
+# full-width pipe, broken bar, CJK vertical line.
+_PIPE_TRANS = str.maketrans({"｜": "|", "¦": "|", "丨": "|"})
+_MATCH_TRANS = str.maketrans({"]": " ", "[": " ", "–": "'"})
+
+def normalize_for_match(s: str) -> str:
+    s = (s or "").lower().translate(_MATCH_TRANS)
+    s = _WS_RE.sub(" ", s).strip()
+    return s
+
+def normalize_text_for_parsing(text: str) -> str:
+    """
+    BULLETPROOF: Normalize OCR text before parsing.
+    Handles all common OCR misreads of pipe and timestamp characters.
+    """
+    if not text:
+        return ""
+    
+    # Replace various pipe-like characters with standard pipe
+    text = text.translate(_PIPE_TRANS)
+    
+    # OCR reads colon as period — only fix when followed by pipe (actual timestamp, not random N.N in messages)
+    text = _DOT_TS_RE.sub(r'\1:\2 \3', text)
+    
+    # IMPROVED: Handle "I" and "l" as pipe in timestamp context
+    # Matches patterns like: "08:15I msg", "08:15 I msg", "8:5I msg"
+    text = _I_PIPE_RE.sub(r'\1 | ', text)  # I after timestamp
+    text = _L_PIPE_RE.sub(r'\1 | ', text)  # lowercase l
+    
+    # Normalize whitespace
+    text = _WS_RE.sub(' ', text)
+    
+    return text.strip()
+
+def latest_msg_is_warm(msg: str) -> bool:
+    m = normalize_for_match(msg)
+    return bool(WARM_WORD_RE.search(m))
+
+def _now_minute_of_day() -> float:
+    now = datetime.now()
+    return now.hour * 60 + now.minute + (now.second + now.microsecond / 1e6) / 60.0
+
+def minutes_since_hhmm(hh: int, mm: int, now_min: Optional[float] = None) -> float:
+    """Minutes from the most recent past HH:MM (today, else yesterday) to now.
+
+    now_min (minute of day, as from _now_minute_of_day) lets a caller scoring
+    many timestamps read the clock once; plain arithmetic, no datetime objects."""
+    if not (0 <= hh < 24 and 0 <= mm < 60):
+        raise ValueError(f"invalid time {hh}:{mm}")
+    if now_min is None:
+        now_min = _now_minute_of_day()
+    mins = now_min - (hh * 60 + mm)
+    if mins < 0:
+        mins += 24 * 60
+    return mins
+
+
+# One-slot memo of the clock-independent half of find_latest_entry: the
+# logbox text rarely changes between polls (the OCR-skip reuses the very same
+# string), so normalize + regex scan run once per distinct text. The scores
+# ("minutes ago") are still recomputed on every call.
+_parse_cache = (None, ())
+
+
+def _parse_entries(text: str) -> tuple:
+    """(hh, mm, msg) of every usable timestamped entry in raw OCR text."""
+    global _parse_cache
+    if _parse_cache[0] == text:
+        return _parse_cache[1]
+
+    entries = []
+    for m in ENTRY_RE.finditer(normalize_text_for_parsing(text)):
+        hh = int(m.group("hh"))
+        mm = int(m.group("mm"))
+        msg = (m.group("msg") or "").strip()
+
+        # Skip empty messages
+        if len(msg) < 2:
+            continue
+
+        # [012]?\d also matches 24-29 — an OCR misread, not a time
+        if hh > 23:
+            continue
+
+        entries.append((hh, mm, msg))
+
+    _parse_cache = (text, tuple(entries))
+    return _parse_cache[1]
+
+
+def find_latest_entry(text: str, debug=False) -> Tuple[Optional[float], Optional[int], Optional[int], Optional[str], Optional[str]]:
+    """
+    Parse OCR text for timestamped log entries (HH:MM | message).
+    Returns the entry whose timestamp is closest to the PC's current local time.
+    Old entries are not skipped — even very old timestamps are considered,
+    because if that's the only entry visible it tells us the log is stale.
+    Only unusable entries are dropped (see _parse_entries): messages under two
+    characters and hours 24-29, which are OCR misreads rather than times.
+    """
+    if not text:
+        return None, None, None, None, None
+
+    best_minutes = None
+    best_hh = None
+    best_mm = None
+    best_line = None
+    best_msg = None
+
+    all_matches = []
+    now_min = _now_minute_of_day()  # one clock read for every entry
+
+    for hh, mm, msg in _parse_entries(text):
+        mins = minutes_since_hhmm(hh, mm, now_min)
+
+        if debug:
+            all_matches.append((hh, mm, mins, msg[:50]))
+
+        # Keep the entry closest to now (most recent)
+        if best_minutes is None or mins < best_minutes:
+            best_minutes = mins
+            best_hh = hh
+            best_mm = mm
+            compact_msg = _WS_RE.sub(" ", msg).strip()
+            best_line = f"{hh:02d}:{mm:02d} | {compact_msg}"
+            best_msg = msg
+
+    # Debug output
+    if debug and all_matches:
+        now_str = datetime.now().strftime("%H:%M:%S")
+        print(f"   Found {len(all_matches)} timestamp(s) (PC time: {now_str}):")
+        for hh, mm, mins, msg in all_matches[:5]:
+            marker = ">>>" if (best_hh == hh and best_mm == mm) else "   "
+            print(f"   {marker} {hh:02d}:{mm:02d} ({mins:.1f} min ago) - {msg}")
+
+    return best_minutes, best_hh, best_mm, best_line, best_msg
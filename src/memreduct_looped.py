@@ -1,5 +1,7 @@
+import ctypes
 import os
 import time
+from ctypes import wintypes
 
 from steps.memreduct import run as mem_clean
 from utils import load_yaml, exe_dir
@@ -8,6 +10,37 @@ from auto_updater import check_updates
 # MemReductLooped.exe is a deployed app; it self-updates from releases/latest.
 MEMREDUCT_UPDATE_CONFIG = os.path.join(exe_dir(), "config", "memreduct_update_config.yaml")
 
+# Defaults for the optional `memreduct_loop:` section of regions.yaml.
+POLL_SECONDS = 30
+THRESHOLD_PCT = 80
+MIN_INTERVAL_SECONDS = 5 * 60
+UPDATE_CHECK_SECONDS = 10 * 60
+
+
+class MEMORYSTATUSEX(ctypes.Structure):
+    _fields_ = [
+        ("dwLength", wintypes.DWORD),
+        ("dwMemoryLoad", wintypes.DWORD),
+        ("ullTotalPhys", ctypes.c_ulonglong),
+        ("ullAvailPhys", ctypes.c_ulonglong),
+        ("ullTotalPageFile", ctypes.c_ulonglong),
+        ("ullAvailPageFile", ctypes.c_ulonglong),
+        ("ullTotalVirtual", ctypes.c_ulonglong),
+        ("ullAvailVirtual", ctypes.c_ulonglong),
+        ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+    ]
+
+
+_mem_status = MEMORYSTATUSEX(dwLength=ctypes.sizeof(MEMORYSTATUSEX))
+
+
+def memory_used_pct() -> float:
+    """Physical memory in use, 0-100. A single kernel call — cheap to poll."""
+    if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(_mem_status)):
+        raise ctypes.WinError()
+    total = _mem_status.ullTotalPhys
+    return 100.0 * (total - _mem_status.ullAvailPhys) / total if total else 0.0
+
 
 def _check_update() -> None:
     """Check for a MemReductLooped.exe update. Never lets an updater error
@@ -27,19 +60,43 @@ def main():
     paths = cfg.get("paths", {})
     mem_exe = paths["memreduct_exe"][0]
 
+    loop_cfg = cfg.get("memreduct_loop", {}) or {}
+    poll_s = float(loop_cfg.get("poll_seconds", POLL_SECONDS))
+    threshold_pct = float(loop_cfg.get("threshold_pct", THRESHOLD_PCT))
+    min_interval_s = float(loop_cfg.get("min_interval_seconds", MIN_INTERVAL_SECONDS))
+    print(f"👀 Cleaning when memory > {threshold_pct:.0f}% "
+          f"(poll {poll_s:.0f}s, at most every {min_interval_s:.0f}s)")
+
+    # Clean only when memory is actually high instead of blindly every 10 min:
+    # idle machines are left alone, spikes are caught within one poll, and the
+    # min interval stops a machine that stays above threshold from re-cleaning
+    # every poll.
+    last_clean = float("-inf")
+    last_update_check = time.monotonic()
     while True:
-        # Loop runs every ~10 min, so one check per iteration is the update
-        # cadence — cheap and guarded so it can never break the loop.
-        _check_update()
+        # Keep the old ~10 min update cadence — cheap and guarded so it can
+        # never break the loop.
+        now = time.monotonic()
+        if now - last_update_check >= UPDATE_CHECK_SECONDS:
+            last_update_check = now
+            _check_update()
 
         try:
-            mem_clean({"exe_path": mem_exe})
+            used = memory_used_pct()
         except Exception as e:
-            print(f"⚠️  Error: {e}")
-            print("   Continuing anyway...")
+            print(f"⚠️  Memory status unavailable ({e}) — cleaning anyway")
+            used = 100.0
+
+        if used > threshold_pct and now - last_clean >= min_interval_s:
+            print(f"🧹 Memory at {used:.0f}% — cleaning")
+            last_clean = now
+            try:
+                mem_clean({"exe_path": mem_exe})
+            except Exception as e:
+                print(f"⚠️  Error: {e}")
+                print("   Continuing anyway...")
 
-        print("💤 Sleeping 10 min...")
-        time.sleep(10 * 60)
+        time.sleep(poll_s)
 
 if __name__ == "__main__":
     main()
@@ -154,10 +154,11 @@ def _watch_logbox_for(hwnd: int, region: dict, phrase: str,
                       timeout_s: float, poll_s: float,
                       log: logging.Logger) -> bool:
     needle = phrase.lower()
-    deadline = time.time() + timeout_s
+    # monotonic: an NTP step right after boot must not stretch/cut the wait
+    deadline = time.monotonic() + timeout_s
     iteration = 0
     last_snippet: str = ""
-    while time.time() < deadline:
+    while True:
         iteration += 1
         write_heartbeat(HEARTBEAT_NAME)
         img = capture_window_region_pct(
@@ -181,7 +182,7 @@ def _watch_logbox_for(hwnd: int, region: dict, phrase: str,
             if snippet != last_snippet:
                 log.info("Logbox poll %d: %r", iteration, snippet)
                 last_snippet = snippet
-        remaining = deadline - time.time()
+        remaining = deadline - time.monotonic()
         if remaining <= 0:
             break
         time.sleep(min(poll_s, remaining))
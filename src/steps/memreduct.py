@@ -4,10 +4,21 @@ steps/memreduct.py - Launch MemReduct and click Clean button
 FIXED: Removed set_focus() which was causing SetForegroundWindow errors
 """
 
+import sys
 import time
 import subprocess
+import ctypes
+from ctypes import wintypes
+from pathlib import Path
 from pywinauto import Desktop
 
+# Ensure ../ (src) is on sys.path
+_SRC_DIR = Path(__file__).resolve().parent.parent
+if str(_SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(_SRC_DIR))
+
+from winops import wait_for_input_idle
+
 
 TITLE = "Mem Reduct"
 CLASS = "#32770"
@@ -20,6 +31,51 @@ def _get_window(timeout_s=5):
     return w
 
 
+_WM_COMMAND = 0x0111
+_BN_CLICKED = 0
+
+# Private WinDLL, so the argtypes set here don't leak into ctypes.windll for
+# other modules. HWND restypes matter: untyped, ctypes truncates handles to a
+# C int on x64.
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+_user32.IsWindow.argtypes = [wintypes.HWND]
+_user32.IsWindow.restype = wintypes.BOOL
+_user32.GetParent.argtypes = [wintypes.HWND]
+_user32.GetParent.restype = wintypes.HWND
+_user32.FindWindowExW.argtypes = [wintypes.HWND, wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR]
+_user32.FindWindowExW.restype = wintypes.HWND
+_user32.GetDlgCtrlID.argtypes = [wintypes.HWND]
+_user32.GetDlgCtrlID.restype = ctypes.c_int
+_user32.PostMessageW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+_user32.PostMessageW.restype = wintypes.BOOL
+
+# Parent dialog HWND -> "Clean memory" button HWND. The dialog layout is
+# fixed, so the child only needs finding once per MemReduct window.
+_CLEAN_BTN_CACHE = {}
+
+
+def _clean_button(parent_hwnd):
+    btn = _CLEAN_BTN_CACHE.get(parent_hwnd)
+    if btn and _user32.IsWindow(btn) and _user32.GetParent(btn) == parent_hwnd:
+        return btn
+    btn = _user32.FindWindowExW(parent_hwnd, None, "Button", CLEAN_TITLE)
+    if btn:
+        _CLEAN_BTN_CACHE[parent_hwnd] = btn
+    return btn
+
+
+def _post_clean_click(parent_hwnd):
+    """Click Clean by posting BN_CLICKED to the dialog — what a real click
+    ends up sending, but needs no restore/focus/mouse move. (BM_CLICK is
+    unreliable when the dialog isn't the active window.) False if the
+    button can't be found."""
+    btn = _clean_button(parent_hwnd)
+    if not btn:
+        return False
+    ctrl_id = _user32.GetDlgCtrlID(btn)
+    return bool(_user32.PostMessageW(parent_hwnd, _WM_COMMAND, (_BN_CLICKED << 16) | ctrl_id, btn))
+
+
 def run(config=None, context=None):
     """
     Launch MemReduct (if not running) and click Clean button.
@@ -36,21 +92,29 @@ def run(config=None, context=None):
             raise RuntimeError("MemReduct: exe_path not provided and window not found.")
         
         print(f"   Launching MemReduct: {exe_path}")
-        subprocess.Popen(exe_path, shell=False)
+        proc = subprocess.Popen(exe_path, shell=False)
+        # Once idle the window normally exists and the wait below returns on
+        # its first check; otherwise it keeps polling as before.
+        wait_for_input_idle(proc.pid, 5000)
         win = _get_window(timeout_s=10)
         print("   MemReduct launched")
 
-    # 2) Restore window if minimized (no focus needed)
+    # 2) Click Clean button
+    print("   Clicking Clean button...")
     try:
-        win.restore()
+        posted = _post_clean_click(win.wrapper_object().handle)
     except Exception:
-        pass
-    
-    time.sleep(0.5)
+        posted = False
+
+    if not posted:
+        # Fallback: the old restore + real mouse click path
+        try:
+            win.restore()
+        except Exception:
+            pass
+        time.sleep(0.5)
+        win.child_window(title=CLEAN_TITLE, class_name="Button").click_input()
 
-    # 3) Click Clean button
-    print("   Clicking Clean button...")
-    win.child_window(title=CLEAN_TITLE, class_name="Button").click_input()
     time.sleep(1.0)
     print("   ✅ Clean clicked")
 
@@ -8,6 +8,7 @@ FIXED:
 - NEW: Positions RDP game windows to screen corners after launch
 - NEW: Logging to logs/rdp_YYYYMMDD.log
 """
+import functools
 import os
 import sys
 from pathlib import Path
@@ -17,9 +18,9 @@ import ctypes
 import ctypes.wintypes
 import win32gui
 import win32con
-import win32api
 import win32process
 import logging
+from logging.handlers import MemoryHandler
 from datetime import datetime
 
 # Ensure ../ (src) is on sys.path
@@ -36,7 +37,9 @@ from winops import (
     assert_foreground,
     pct_to_screen_xy,
     safe_double_click,
+    window_responsive,
 )
+from layout import get_workarea_rect
 from utils import load_yaml
 
 TITLE_SUB = "RDP Session Manager"
@@ -54,17 +57,47 @@ def setup_logging():
     log_file = f"rdp_{datetime.now().strftime('%Y%m%d')}.log"
     log_path = os.path.join(logs_dir, log_file)
     
+    fmt = '%(asctime)s | %(levelname)s | %(message)s'
+
+    # Every step already print()s its own status line, so the console echo
+    # of the log is buffered: records reach the (slow, synchronous) Windows
+    # console in batches, immediately for errors, and at the end of run().
+    global _CONSOLE_LOG_BUFFER
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(fmt))
+    buffered = MemoryHandler(capacity=100, flushLevel=logging.ERROR, target=console)
+
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s | %(levelname)s | %(message)s',
+        format=fmt,
         handlers=[
             logging.FileHandler(log_path, encoding='utf-8'),
-            logging.StreamHandler()
+            buffered,
         ]
     )
+    # basicConfig is a no-op when the host (e.g. Boot) configured logging first
+    if buffered in logging.getLogger().handlers:
+        _CONSOLE_LOG_BUFFER = buffered
     return logging.getLogger(__name__)
 
+
+_CONSOLE_LOG_BUFFER = None
+
+
+def _flush_console_log():
+    if _CONSOLE_LOG_BUFFER is not None:
+        _CONSOLE_LOG_BUFFER.flush()
+
 GW_OWNER = 4  # GetWindow constant for owner hwnd
+VK_RETURN = 0x0D
+KEYEVENTF_KEYUP = 0x0002
+
+
+def _press_enter():
+    """One Enter key press via user32 — what pyautogui.press('enter') does,
+    minus its key-name mapping and the PAUSE it sleeps after every call."""
+    ctypes.windll.user32.keybd_event(VK_RETURN, 0, 0, 0)
+    ctypes.windll.user32.keybd_event(VK_RETURN, 0, KEYEVENTF_KEYUP, 0)
 
 
 def _find_rdp_dialog(parent_hwnd: int):
@@ -130,8 +163,6 @@ def close_confirmation_dialog(hwnd=None, verbose=True,
             print("   ⚠️  close_confirmation_dialog called without parent hwnd — skipping")
         return False
 
-    import pyautogui
-
     deadline = time.time() + appear_timeout_s
     dialog_hwnd = None
     while time.time() < deadline:
@@ -155,7 +186,7 @@ def close_confirmation_dialog(hwnd=None, verbose=True,
     except Exception:
         pass
     time.sleep(0.15)
-    pyautogui.press('enter')
+    _press_enter()
     if verbose:
         print("   🔘 Sent Enter to dialog")
 
@@ -186,6 +217,24 @@ def close_confirmation_dialog(hwnd=None, verbose=True,
     return False
 
 
+def wait_ui_ready(hwnd, timeout_s, poll_s=0.05):
+    """Poll until hwnd is enabled and its UI thread answers messages.
+    True as soon as it is, False after timeout_s."""
+    deadline = time.monotonic() + timeout_s
+    while True:
+        if win32gui.IsWindowEnabled(hwnd) and window_responsive(hwnd, timeout_ms=200):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll_s)
+
+
+@functools.lru_cache(maxsize=8)
+def _rdp_dir(exe_path):
+    """Directory containing RDPClient.exe (resolved once per exe path)."""
+    return os.path.dirname(os.path.abspath(exe_path))
+
+
 def launch_rdp_with_workdir(exe_path, verbose=True):
     """
     Launch RDPClient with its directory as working directory.
@@ -195,7 +244,7 @@ def launch_rdp_with_workdir(exe_path, verbose=True):
         raise RuntimeError(f"RDP exe not found: {exe_path}")
     
     # Get the directory containing RDPClient.exe
-    rdp_dir = os.path.dirname(os.path.abspath(exe_path))
+    rdp_dir = _rdp_dir(exe_path)
     
     if verbose:
         print(f"🚀 Launching RDPClient")
@@ -210,6 +259,19 @@ def launch_rdp_with_workdir(exe_path, verbose=True):
 # NEW FUNCTIONS - Window Positioning (added without changing existing logic)
 # ============================================================================
 
+# Shared user32 handle for the ctypes paths below (private WinDLL, so the
+# argtypes set here don't leak into ctypes.windll for other modules).
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.wintypes.BOOL, ctypes.wintypes.HWND, ctypes.wintypes.LPARAM)
+_user32.EnumWindows.argtypes = [WNDENUMPROC, ctypes.wintypes.LPARAM]
+_user32.IsWindowVisible.argtypes = [ctypes.wintypes.HWND]
+_user32.GetWindowTextW.argtypes = [ctypes.wintypes.HWND, ctypes.wintypes.LPWSTR, ctypes.c_int]
+
+_TEXT_BUF_LEN = 256
+_TEXT_BUF = ctypes.create_unicode_buffer(_TEXT_BUF_LEN)
+
+
 def find_rdp_game_windows(title_substring="SinFermera"):
     """
     Find RDP game windows (SinFermera15, SinFermera16, etc.)
@@ -220,19 +282,146 @@ def find_rdp_game_windows(title_substring="SinFermera"):
     Returns:
         List of (hwnd, title) tuples
     """
+    # Straight ctypes: one C call per HWND into a reused buffer, instead of
+    # pywin32 allocating a fresh string (and a wrapper) per window per poll.
     windows = []
-    
-    def enum_callback(hwnd, results):
-        if win32gui.IsWindowVisible(hwnd):
-            title = win32gui.GetWindowText(hwnd)
-            if title and title_substring.lower() in title.lower():
-                results.append((hwnd, title))
-    
-    win32gui.EnumWindows(enum_callback, windows)
+    needle = title_substring.lower()
+    buf = _TEXT_BUF
+
+    def enum_callback(hwnd, _lparam):
+        if _user32.IsWindowVisible(hwnd) and _user32.GetWindowTextW(hwnd, buf, _TEXT_BUF_LEN):
+            title = buf.value
+            if needle in title.lower():
+                windows.append((hwnd, title))
+        return True
+
+    _user32.EnumWindows(WNDENUMPROC(enum_callback), 0)
+    return windows
+
+
+# --- WinEvent-driven wait for the game windows ------------------------------
+# Instead of re-enumerating every top-level window every 2 s, listen for
+# windows being shown/renamed and only rescan when one of them matches.
+# Out-of-context WinEvents are delivered through this thread's message queue,
+# so the wait pumps messages while it sleeps.
+
+EVENT_OBJECT_SHOW = 0x8002
+EVENT_OBJECT_NAMECHANGE = 0x800C
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+QS_ALLINPUT = 0x04FF
+PM_REMOVE = 0x0001
+
+WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None,
+    ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD, ctypes.wintypes.HWND,
+    ctypes.wintypes.LONG, ctypes.wintypes.LONG,
+    ctypes.wintypes.DWORD, ctypes.wintypes.DWORD,
+)
+_user32.SetWinEventHook.argtypes = [
+    ctypes.wintypes.DWORD, ctypes.wintypes.DWORD, ctypes.wintypes.HMODULE,
+    WINEVENTPROC, ctypes.wintypes.DWORD, ctypes.wintypes.DWORD, ctypes.wintypes.DWORD,
+]
+_user32.SetWinEventHook.restype = ctypes.wintypes.HANDLE
+_user32.UnhookWinEvent.argtypes = [ctypes.wintypes.HANDLE]
+_user32.MsgWaitForMultipleObjects.argtypes = [
+    ctypes.wintypes.DWORD, ctypes.c_void_p, ctypes.wintypes.BOOL,
+    ctypes.wintypes.DWORD, ctypes.wintypes.DWORD,
+]
+_user32.MsgWaitForMultipleObjects.restype = ctypes.wintypes.DWORD
+_user32.PeekMessageW.argtypes = [
+    ctypes.POINTER(ctypes.wintypes.MSG), ctypes.wintypes.HWND,
+    ctypes.wintypes.UINT, ctypes.wintypes.UINT, ctypes.wintypes.UINT,
+]
+
+
+def wait_for_rdp_game_windows(title_search, count=2, max_wait=30.0,
+                              rescan_s=2.0, verbose=True):
+    """
+    Wait up to max_wait seconds for `count` visible windows whose title
+    contains title_search. Returns the find_rdp_game_windows() list
+    (possibly shorter than `count` on timeout).
+
+    Wakes on WinEvents for matching windows; a rescan every rescan_s is kept
+    as a safety net (and is the whole mechanism if the hook can't be set).
+    """
+    windows = find_rdp_game_windows(title_search)
+    if len(windows) >= count:
+        return windows
+
+    needle = title_search.lower()
+    text_buf = ctypes.create_unicode_buffer(_TEXT_BUF_LEN)
+    woke = [False]
+
+    def on_event(_hook, _event, hwnd, id_object, id_child, _thread, _time):
+        if id_object != OBJID_WINDOW or id_child != 0 or not hwnd:
+            return
+        if _user32.GetWindowTextW(hwnd, text_buf, _TEXT_BUF_LEN) and needle in text_buf.value.lower():
+            woke[0] = True
+
+    proc = WINEVENTPROC(on_event)  # must outlive the hooks
+    # One hook per event: a SHOW..NAMECHANGE range would also take
+    # LOCATIONCHANGE, which fires on every cursor and window move.
+    hooks = [
+        h for h in (
+            _user32.SetWinEventHook(
+                event, event, None, proc, 0, 0,
+                WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS,
+            )
+            for event in (EVENT_OBJECT_SHOW, EVENT_OBJECT_NAMECHANGE)
+        ) if h
+    ]
+    if not hooks and verbose:
+        print("   ⚠️  WinEvent hook unavailable — polling")
+
+    msg = ctypes.wintypes.MSG()
+    deadline = time.monotonic() + max_wait
+    next_rescan = time.monotonic() + rescan_s
+    last_count = len(windows)
+    if verbose:
+        print(f"⏳ Waiting... ({last_count}/{count})")
+    try:
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            timeout_ms = int(max(0.0, min(deadline, next_rescan) - now) * 1000)
+            if hooks:
+                _user32.MsgWaitForMultipleObjects(0, None, False, timeout_ms, QS_ALLINPUT)
+                while _user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_REMOVE):
+                    pass  # WinEvent callbacks run inside PeekMessage
+            else:
+                time.sleep(timeout_ms / 1000.0)
+
+            if woke[0] or time.monotonic() >= next_rescan:
+                woke[0] = False
+                next_rescan = time.monotonic() + rescan_s
+                windows = find_rdp_game_windows(title_search)
+                if len(windows) >= count:
+                    break
+                if verbose and len(windows) != last_count:
+                    print(f"⏳ Waiting... ({len(windows)}/{count})")
+                last_count = len(windows)
+    finally:
+        for hook in hooks:
+            _user32.UnhookWinEvent(hook)
     return windows
 
 
-def position_window_to_corner(hwnd, corner, window_size=(640, 480)):
+def corner_xy(corner, window_size, work_area):
+    """Top-left (x, y) for a window of window_size at `corner` of work_area
+    (left, top, right, bottom), or None for an unknown corner."""
+    wa_left, wa_top, wa_right, wa_bottom = work_area
+    width, height = window_size
+    if corner == "top-left":
+        return wa_left, wa_top
+    if corner == "bottom-right":
+        return wa_right - width, wa_bottom - height
+    return None
+
+
+def position_window_to_corner(hwnd, corner, window_size=(640, 480), work_area=None):
     """
     Position a window at a corner of the screen.
     
@@ -240,27 +429,24 @@ def position_window_to_corner(hwnd, corner, window_size=(640, 480)):
         hwnd: Window handle to position
         corner: "top-left" or "bottom-right"
         window_size: (width, height) tuple in pixels
+        work_area: (left, top, right, bottom); read from the system if None
     
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Get usable work area (excludes taskbar regardless of its position)
-        work_area = ctypes.wintypes.RECT()
-        ctypes.windll.user32.SystemParametersInfoW(0x30, 0, ctypes.byref(work_area), 0)
+        # Usable work area (excludes taskbar regardless of its position)
+        if work_area is None:
+            work_area = get_workarea_rect()
 
         width, height = window_size
 
         # Calculate position based on corner, clamped to the work area
-        if corner == "top-left":
-            x = work_area.left
-            y = work_area.top
-        elif corner == "bottom-right":
-            x = work_area.right - width
-            y = work_area.bottom - height
-        else:
+        pos = corner_xy(corner, window_size, work_area)
+        if pos is None:
             print(f"   ⚠️  Unknown corner: {corner}")
             return False
+        x, y = pos
         
         # Restore window if minimized
         win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
@@ -329,28 +515,18 @@ def position_rdp_game_windows(config, verbose=True):
     
     window_size = (window_width, window_height)
     
+    # One work-area read for both windows (and the verbose output)
+    work_area = get_workarea_rect()
+    
     if verbose:
-        screen_width = win32api.GetSystemMetrics(0)
-        screen_height = win32api.GetSystemMetrics(1)
-        
-        print(f"\n📺 Screen: {screen_width}x{screen_height}")
+        wa_left, wa_top, wa_right, wa_bottom = work_area
+        print(f"\n📺 Work area: {wa_right - wa_left}x{wa_bottom - wa_top}")
         print(f"🔍 Looking for '{title_search}' windows...")
     
     # Wait for windows to appear
-    start_time = time.time()
-    windows = []
-    
-    while time.time() - start_time < max_wait:
-        windows = find_rdp_game_windows(title_search)
-        
-        if len(windows) >= 2:
-            if verbose:
-                print(f"✅ Found {len(windows)} window(s)")
-            break
-        else:
-            if verbose:
-                print(f"⏳ Waiting... ({len(windows)}/2)")
-            time.sleep(2)
+    windows = wait_for_rdp_game_windows(title_search, 2, max_wait, verbose=verbose)
+    if len(windows) >= 2 and verbose:
+        print(f"✅ Found {len(windows)} window(s)")
     
     if len(windows) < 2:
         if verbose:
@@ -360,27 +536,41 @@ def position_rdp_game_windows(config, verbose=True):
     if verbose:
         print(f"\n📐 Positioning {window_width}x{window_height} windows...")
     
-    # Position Window 1: Top-left
-    hwnd1, title1 = windows[0]
-    if verbose:
-        print(f"\n   '{title1}' → Top-left (0, 0)")
-    
-    success1 = position_window_to_corner(hwnd1, "top-left", window_size)
+    placements = [
+        (windows[0], "top-left", "Top-left"),
+        (windows[1], "bottom-right", "Bottom-right"),
+    ]
     if verbose:
-        print(f"      {'✅' if success1 else '❌'}")
+        for (hwnd, title), corner, label in placements:
+            x, y = corner_xy(corner, window_size, work_area)
+            print(f"\n   '{title}' → {label} ({x}, {y})")
     
-    time.sleep(0.3)
-    
-    # Position Window 2: Bottom-right
-    hwnd2, title2 = windows[1]
-    if verbose:
-        x2 = win32api.GetSystemMetrics(0) - window_width
-        y2 = win32api.GetSystemMetrics(1) - window_height
-        print(f"\n   '{title2}' → Bottom-right ({x2}, {y2})")
-    
-    success2 = position_window_to_corner(hwnd2, "bottom-right", window_size)
+    # Move both in one DeferWindowPos transaction: a single recomposite
+    # instead of two independent move/redraw cascades.
+    try:
+        for (hwnd, _title), _corner, _label in placements:
+            # Restore if minimized (SetWindowPos doesn't un-minimize)
+            win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+        hdwp = win32gui.BeginDeferWindowPos(len(placements))
+        for (hwnd, _title), corner, _label in placements:
+            x, y = corner_xy(corner, window_size, work_area)
+            hdwp = win32gui.DeferWindowPos(
+                hdwp, hwnd, win32con.HWND_TOP,
+                x, y, window_width, window_height,
+                win32con.SWP_SHOWWINDOW,
+            )
+        win32gui.EndDeferWindowPos(hdwp)
+        results = [True] * len(placements)
+    except Exception as e:
+        if verbose:
+            print(f"   ⚠️  Batched move failed ({e}) — moving one by one")
+        results = [
+            position_window_to_corner(hwnd, corner, window_size, work_area)
+            for (hwnd, _title), corner, _label in placements
+        ]
     if verbose:
-        print(f"      {'✅' if success2 else '❌'}")
+        print(f"      {' '.join('✅' if ok else '❌' for ok in results)}")
+    success1, success2 = results
     focus_rdp_game_windows(windows, verbose=verbose)
         
     return success1 and success2
@@ -392,6 +582,13 @@ def position_rdp_game_windows(config, verbose=True):
 # ============================================================================
 
 
+def _say(log, icon, msg, level=logging.INFO):
+    """Log msg and print it to the console with its emoji prefix — one
+    message string for both instead of two hand-maintained variants."""
+    log.log(level, msg)
+    print(f"{icon}{msg}")
+
+
 def run(config=None, context=None):
     """
     Launch RDPClient and double-click User1 and User2 entries.
@@ -501,20 +698,18 @@ def run(config=None, context=None):
     if not already_open:
         # 1) Find or launch RDPClient
         m = find_window(TITLE_SUB, require_visible=True)
+        launched = not m
         if not m:
-            log.info("RDPClient window not found, launching...")
-            print("⚠️  RDPClient not found, launching...")
+            _say(log, "⚠️  ", "RDPClient window not found, launching...")
 
             # Launch with working directory set (CRITICAL FIX!)
             launch_rdp_with_workdir(exe_path, verbose=True)
 
-            log.info("Waiting for RDPClient window (25s timeout)")
-            print("⏳ Waiting for window (25s)...")
+            _say(log, "⏳ ", "Waiting for RDPClient window (25s timeout)")
             m = wait_for_window(TITLE_SUB, timeout_s=25.0, require_visible=True)
 
         if not m:
-            log.error("RDPClient window not found after launch")
-            print("❌ Window not found after launch")
+            _say(log, "❌ ", "RDPClient window not found after launch", logging.ERROR)
             raise RuntimeError("RDP: window not found after launch.")
 
         log.info(f"Found RDPClient Window (HWND: {m.hwnd}, Title: {m.title})")
@@ -523,67 +718,63 @@ def run(config=None, context=None):
         print(f"   Title: {m.title}")
 
         # 2) Wait for UI and user list to fully load
-        log.info(f"Waiting {ui_wait_s}s for UI and user list to load")
-        print(f"\n⏳ Waiting {ui_wait_s}s for UI...")
-        time.sleep(ui_wait_s)
+        if launched:
+            # Fresh process: nothing observable says the user list is
+            # populated, so keep the full stabilization wait.
+            _say(log, "\n⏳ ", f"Waiting {ui_wait_s}s for UI and user list to load")
+            time.sleep(ui_wait_s)
+        else:
+            # Already running: the list is loaded — only make sure the
+            # window is enabled and responsive (normally instant).
+            _say(log, "\n⏳ ", f"RDPClient already open, checking UI is ready (≤{ui_wait_s}s)")
+            if not wait_ui_ready(m.hwnd, ui_wait_s):
+                _say(log, "⚠️  ", "RDPClient UI not ready after wait — continuing", logging.WARNING)
 
         # 3) Force focus before first click
-        log.info("Focusing RDPClient window")
-        print("\n🎯 Focusing RDPClient...")
+        _say(log, "\n🎯 ", "Focusing RDPClient window")
         if not force_foreground(m.hwnd):
-            log.error("Failed to focus RDPClient")
-            print("❌ Failed to focus RDPClient")
+            _say(log, "❌ ", "Failed to focus RDPClient", logging.ERROR)
             raise RuntimeError("RDP: could not foreground (safety stop).")
 
         assert_foreground(m.hwnd)
-        log.info("Window focused")
-        print("✅ Focused")
+        _say(log, "✅ ", "Window focused")
 
         time.sleep(0.3)
 
         # 4) Double-click User1
         x1, y1 = pct_to_screen_xy(m.hwnd, float(user1["x"]), float(user1["y"]))
 
-        log.info(f"Double-clicking User1 at ({user1['x']:.4f}, {user1['y']:.4f}) → screen ({x1}, {y1})")
-        print(f"\n🖱️  Double-clicking User1  ({user1['x']:.4f}, {user1['y']:.4f}) → ({x1}, {y1})")
+        _say(log, "\n🖱️  ", f"Double-clicking User1 at ({user1['x']:.4f}, {user1['y']:.4f}) → screen ({x1}, {y1})")
 
         safe_double_click(x1, y1)
-        log.info("User1 double-clicked")
-        print("✅ User1 clicked")
+        _say(log, "✅ ", "User1 double-clicked")
 
         # 4a) Close confirmation dialog (poller waits up to 5s for it to appear)
-        log.info("Waiting for User1 confirmation dialog")
-        print("⏳ Waiting for dialog to appear...")
+        _say(log, "⏳ ", "Waiting for User1 confirmation dialog")
         close_confirmation_dialog(hwnd=m.hwnd, verbose=True)
         time.sleep(0.5)
 
         # 5) Refocus RDPClient for second click
-        log.info("Re-focusing RDPClient window")
-        print("\n🎯 Re-focusing RDPClient...")
+        _say(log, "\n🎯 ", "Re-focusing RDPClient window")
         if not force_foreground(m.hwnd):
-            log.error("Failed to re-focus RDPClient after User1")
-            print("❌ Re-focus failed after User1")
+            _say(log, "❌ ", "Failed to re-focus RDPClient after User1", logging.ERROR)
             raise RuntimeError("RDP: could not refocus after user1 (safety stop).")
 
         assert_foreground(m.hwnd)
-        log.info("Window re-focused")
-        print("✅ Re-focused")
+        _say(log, "✅ ", "Window re-focused")
 
         time.sleep(0.3)
 
         # 6) Double-click User2
         x2, y2 = pct_to_screen_xy(m.hwnd, float(user2["x"]), float(user2["y"]))
 
-        log.info(f"Double-clicking User2 at ({user2['x']:.4f}, {user2['y']:.4f}) → screen ({x2}, {y2})")
-        print(f"\n🖱️  Double-clicking User2  ({user2['x']:.4f}, {user2['y']:.4f}) → ({x2}, {y2})")
+        _say(log, "\n🖱️  ", f"Double-clicking User2 at ({user2['x']:.4f}, {user2['y']:.4f}) → screen ({x2}, {y2})")
 
         safe_double_click(x2, y2)
-        log.info("User2 double-clicked")
-        print("✅ User2 clicked")
+        _say(log, "✅ ", "User2 double-clicked")
 
         # 6a) Close confirmation dialog (poller waits up to 5s for it to appear)
-        log.info("Waiting for User2 confirmation dialog")
-        print("⏳ Waiting for dialog to appear...")
+        _say(log, "⏳ ", "Waiting for User2 confirmation dialog")
         close_confirmation_dialog(hwnd=m.hwnd, verbose=True)
         time.sleep(0.5)
 
@@ -608,11 +799,9 @@ def run(config=None, context=None):
             
             success = position_rdp_game_windows(rdp_windows_cfg, verbose=True)
             if success:
-                log.info("Game windows positioned successfully")
-                print("✅ Positioned correctly")
+                _say(log, "✅ ", "Game windows positioned successfully")
             else:
-                log.warning("Game window positioning incomplete")
-                print("⚠️  Positioning incomplete")
+                _say(log, "⚠️  ", "Game window positioning incomplete", logging.WARNING)
     except Exception as e:
         log.warning(f"Window positioning failed: {e}")
         print(f"\n⚠️  Window positioning failed: {e}")
@@ -622,6 +811,7 @@ def run(config=None, context=None):
     log.info("=" * 70)
     log.info("RDP AUTOMATION FINISHED")
     log.info("=" * 70)
+    _flush_console_log()
     
     return True
 
@@ -37,12 +37,13 @@ def find_rdp_windows(title_substring="SinFermera"):
     """
     from winops import resolve_real_hwnd, process_image_of
     windows = []
+    needle = title_substring.lower()  # once, not per enumerated window
 
     def enum_callback(hwnd, results):
         if not win32gui.IsWindowVisible(hwnd):
             return
         title = win32gui.GetWindowText(hwnd)
-        if not (title and title_substring.lower() in title.lower()):
+        if not (title and needle in title.lower()):
             return
         real = resolve_real_hwnd(hwnd)
         if process_image_of(real) != "wfreerdp.exe":
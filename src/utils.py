@@ -1,9 +1,23 @@
+import atexit
+import functools
+import json
 import os
+import queue
 import sys
+import time
 import yaml
 import logging
+import logging.handlers
 from datetime import datetime
 
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml, ~10x faster
+except ImportError:
+    from yaml import SafeLoader
+
+# Both are fixed for the life of the process; heartbeat/log/config paths ask
+# for them on every write, so compute once.
+@functools.lru_cache(maxsize=None)
 def runtime_root() -> str:
     # Where PyInstaller puts bundled files
     if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
@@ -11,43 +25,141 @@ def runtime_root() -> str:
     # Running from source: project root is parent of /src
     return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+@functools.lru_cache(maxsize=None)
 def exe_dir() -> str:
     # Folder where Watchdog.exe lives (good for logs)
     if getattr(sys, "frozen", False):
         return os.path.dirname(sys.executable)
     return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+def _parse_yaml_file(abs_path: str):
+    # Hand libyaml the raw bytes — it decodes UTF-8 itself, no Python-side
+    # text layer. Only non-UTF-8 files pay for a decode + second parse.
+    with open(abs_path, "rb") as f:
+        data = f.read()
+    try:
+        return yaml.load(data, Loader=SafeLoader)
+    except yaml.reader.ReaderError:
+        pass
+    for enc in ("cp1252", "cp1251"):
+        try:
+            return yaml.load(data.decode(enc), Loader=SafeLoader)
+        except UnicodeDecodeError:
+            continue
+    # Last resort: ignore bad bytes
+    return yaml.load(data.decode("utf-8", errors="replace"), Loader=SafeLoader)
+
+def _read_sidecar(cache_path: str, key: list):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            return True, cached["data"]
+    except Exception:
+        pass
+    return False, None
+
+def _write_sidecar(cache_path: str, key: list, data) -> None:
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        # JSON can't hold everything YAML can (int keys, dates) — only cache
+        # configs that survive the round trip unchanged.
+        payload = json.dumps({"key": key, "data": data}, ensure_ascii=False)
+        if json.loads(payload)["data"] != data:
+            return
+        # Write-then-rename so a concurrent reader never sees half a file.
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        # Read-only dir (e.g. _MEIPASS) or a race with another process —
+        # the cache is only an optimisation.
+        try:
+            os.remove(tmp_path)
+        except Exception:
+            pass
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(abs_path: str, mtime_ns: int, size: int):
+    # PyYAML is slow; a JSON sidecar keyed on mtime+size lets every later
+    # process start (Boot, Watchdog, MemReductLooped...) skip it entirely.
+    cache_path = abs_path + ".cache.json"
+    key = [mtime_ns, size]
+    hit, data = _read_sidecar(cache_path, key)
+    if hit:
+        return data
+    data = _parse_yaml_file(abs_path)
+    _write_sidecar(cache_path, key, data)
+    return data
+
 def load_yaml(rel_path: str) -> dict:
-    # 1) Prefer editable files next to the EXE (or project root in dev)
+    # Result is shared between callers (in-process cache) — treat as read-only.
+    # 1) Prefer editable files next to the EXE (or project root in dev).
+    # Probed on every call, not cached: an editable copy dropped there later
+    # must still be picked up by long-running processes. The stat doubles as
+    # the cache key, so this costs one stat when the copy exists.
     abs_path = os.path.join(exe_dir(), rel_path)
-    if not os.path.exists(abs_path):
+    try:
+        st = os.stat(abs_path)
+    except FileNotFoundError:
         # 2) Fallback to bundled PyInstaller internal files
         abs_path = os.path.join(runtime_root(), rel_path)
+        st = os.stat(abs_path)
+    return _load_yaml_cached(abs_path, st.st_mtime_ns, st.st_size)
 
-    for enc in ("utf-8", "cp1252", "cp1251"):
-        try:
-            with open(abs_path, "r", encoding=enc) as f:
-                return yaml.safe_load(f)
-        except UnicodeDecodeError:
-            continue
-    # Last resort: ignore bad bytes
-    with open(abs_path, "r", encoding="utf-8", errors="replace") as f:
-        return yaml.safe_load(f)
+class _CachedTimeFormatter(logging.Formatter):
+    # Same "%Y-%m-%d %H:%M:%S,mmm" asctime as the default formatter, but
+    # strftime runs once per second instead of once per record.
+    _last_sec = None
+    _last_str = ""
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = time.strftime(self.default_time_format, self.converter(sec))
+            self._last_sec = sec
+        return self.default_msec_format % (self._last_str, record.msecs)
+
+_log_listener = None
 
 def setup_logger():
+    global _log_listener
+    if _log_listener is not None:
+        return logging.getLogger("watchdog")
+
     logs_dir = os.path.join(exe_dir(), "logs")
     os.makedirs(logs_dir, exist_ok=True)
 
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_path = os.path.join(logs_dir, f"watchdog_{ts}.log")
 
+    # File + console writes happen on a listener thread; the poll loop only
+    # enqueues. QueueHandler merges args (and any traceback) into the message
+    # — hence its bare "%(message)s" — and the listener's handlers add the
+    # timestamp/level layout.
+    # LogRecord fields our format never prints — skip their per-record lookups.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    formatter = _CachedTimeFormatter("%(asctime)s | %(levelname)s | %(message)s")
+    file_handler = logging.FileHandler(log_path, encoding="utf-8")
+    console_handler = logging.StreamHandler()
+    for h in (file_handler, console_handler):
+        h.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+    _log_listener.start()
+    # Drains whatever is still queued on normal exit / unhandled exception
+    atexit.register(_log_listener.stop)
+
     logging.basicConfig(
         level=logging.INFO,
-        format="%(asctime)s | %(levelname)s | %(message)s",
-        handlers=[
-            logging.FileHandler(log_path, encoding="utf-8"),
-            logging.StreamHandler(),
-        ],
+        format="%(message)s",
+        handlers=[logging.handlers.QueueHandler(log_queue)],
     )
     return logging.getLogger("watchdog")
 
@@ -5,33 +5,78 @@ This stays intentionally simple: no OCR here, only "is the UI rendered yet?" che
 """
 from __future__ import annotations
 
+import atexit
 import time
 from typing import Optional, Tuple
 
 import cv2
 import numpy as np
-import pyautogui
-import win32gui
+
+from winops import client_geom
+
+
+_SCT = None
+
+
+def _mss():
+    """One mss session for the whole process — mss() allocates DCs on creation."""
+    global _SCT
+    if _SCT is None:
+        import mss
+        _SCT = mss.mss()
+        atexit.register(_SCT.close)
+    return _SCT
+
+
+# Reused per-shape output buffers: the capture region is the same on
+# every poll, so steady state allocates nothing.
+_BUFS = {}
+
+
+def _buf(name: str, shape: tuple) -> np.ndarray:
+    key = (name, shape)
+    b = _BUFS.get(key)
+    if b is None:
+        if len(_BUFS) > 16:  # window resized a few times — start over
+            _BUFS.clear()
+        b = _BUFS[key] = np.empty(shape, dtype=np.uint8)
+    return b
+
+
+def _grab_bgra(region: Tuple[int, int, int, int]) -> np.ndarray:
+    """Screen (x, y, w, h) -> HxWx4 BGRA view over mss's raw buffer (no copy)."""
+    x, y, w, h = region
+    shot = _mss().grab({"left": x, "top": y, "width": w, "height": h})
+    return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+
+# Geometry reuse covers a couple of polls of the same window; a window moved
+# in between is re-read within a second, which only costs that one
+# "not loaded yet" check.
+_CLIENT_GEOM_MAX_AGE_S = 1.0
+
+
+def _region_pct_to_screen(hwnd: int, x_pct: float, y_pct: float, w_pct: float, h_pct: float) -> Tuple[int, int, int, int]:
+    """Client-area percentages -> screen (x, y, w, h)."""
+    cw, ch, cx, cy = client_geom(hwnd, max_age_s=_CLIENT_GEOM_MAX_AGE_S)
+    x = cx + int(cw * x_pct)
+    y = cy + int(ch * y_pct)
+    w = max(1, int(cw * w_pct))
+    h = max(1, int(ch * h_pct))
+    return x, y, w, h
 
 
 def capture_window_region_pct(hwnd: int, x_pct: float, y_pct: float, w_pct: float, h_pct: float) -> Optional[np.ndarray]:
     """
     Capture a region of the *client area* using percentages.
     Returns BGR image (OpenCV) or None.
+    The array is a reused buffer, valid until the next capture — copy() to keep it.
     """
     try:
-        cl, ct, cr, cb = win32gui.GetClientRect(hwnd)
-        cw = cr - cl
-        ch = cb - ct
-        cx, cy = win32gui.ClientToScreen(hwnd, (0, 0))
-
-        x = cx + int(cw * x_pct)
-        y = cy + int(ch * y_pct)
-        w = max(1, int(cw * w_pct))
-        h = max(1, int(ch * h_pct))
-
-        shot = pyautogui.screenshot(region=(x, y, w, h))
-        return cv2.cvtColor(np.array(shot), cv2.COLOR_RGB2BGR)
+        bgra = _grab_bgra(_region_pct_to_screen(hwnd, x_pct, y_pct, w_pct, h_pct))
+        # mss is already BGR(A): dropping alpha is the only conversion left
+        h, w = bgra.shape[:2]
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=_buf("bgr", (h, w, 3)))
     except Exception:
         return None
 
@@ -41,16 +86,30 @@ def is_ui_loaded_basic(hwnd: int) -> bool:
     Heuristic: capture center region and ensure it's not blank (white/black) and has variance.
     Useful for apps that show blank/loading placeholder frames right after launch.
     """
-    img = capture_window_region_pct(hwnd, 0.2, 0.2, 0.6, 0.6)
-    if img is None:
+    try:
+        bgra = _grab_bgra(_region_pct_to_screen(hwnd, 0.2, 0.2, 0.6, 0.6))
+    except Exception:
         return False
 
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-    mean_brightness = float(gray.mean())
+    # Early exit for the common startup case (solid white/black loader):
+    # a 16x16 grid of the green channel (the dominant luminance weight) is
+    # enough to reject it before converting and reducing the whole frame.
+    h, w = bgra.shape[:2]
+    probe = bgra[::max(1, h // 16), ::max(1, w // 16), 1]
+    if probe.min() > 240 or probe.max() < 15:
+        return False
+
+    # Coarse stats are enough here: every 4th pixel on each axis. Decimate
+    # before the gray conversion so the 15/16 of pixels the stats never look
+    # at aren't converted either; then mean and std in one OpenCV pass.
+    small = bgra[::4, ::4]
+    gray = cv2.cvtColor(small, cv2.COLOR_BGRA2GRAY, dst=_buf("gray_s", small.shape[:2]))
+    mean, std = cv2.meanStdDev(gray)
+    mean_brightness = float(mean[0, 0])
     if mean_brightness > 240 or mean_brightness < 15:
         return False
 
-    std_dev = float(gray.std())
+    std_dev = float(std[0, 0])
     if std_dev < 10:
         return False
 
@@ -60,22 +119,30 @@ def is_ui_loaded_basic(hwnd: int) -> bool:
 def wait_for_ui_loaded(
     hwnd: int,
     max_wait_s: float = 15.0,
-    check_interval_s: float = 0.5,
+    check_interval_s: float = 0.1,
     required_consecutive: int = 2,
     verbose: bool = True,
+    max_interval_s: float = 0.5,
 ) -> bool:
     """
     Wait for is_ui_loaded_basic() to be True N consecutive times.
+    Polls start every check_interval_s and back off x1.5 per failed check up to
+    max_interval_s: fast UIs are caught early, slow ones don't get hammered.
     """
-    deadline = time.time() + max_wait_s
+    # Monotonic, tick-anchored schedule: capture time doesn't stretch the
+    # cadence, and the last sleep never overshoots the deadline.
+    next_tick = time.monotonic()
+    deadline = next_tick + max_wait_s
+    interval = check_interval_s
     consecutive = 0
 
     if verbose:
         print(f"\n⏳ Waiting for UI to load (max {max_wait_s}s)...")
 
-    while time.time() < deadline:
+    while True:
         if is_ui_loaded_basic(hwnd):
             consecutive += 1
+            interval = check_interval_s
             if verbose:
                 print(f"   ✓ UI appears loaded ({consecutive}/{required_consecutive})")
             if consecutive >= required_consecutive:
@@ -86,8 +153,16 @@ def wait_for_ui_loaded(
             if consecutive > 0 and verbose:
                 print("   ⚠ UI not stable, rechecking...")
             consecutive = 0
-
-        time.sleep(check_interval_s)
+            interval = min(max_interval_s, interval * 1.5)
+
+        next_tick += interval
+        # One clock read per iteration covers both the deadline and the sleep
+        now = time.monotonic()
+        if now >= deadline:
+            break
+        delay = min(next_tick, deadline) - now
+        if delay > 0:
+            time.sleep(delay)
 
     if verbose:
         print(f"⚠️  UI load timeout reached ({max_wait_s}s)")
@@ -1,32 +1,28 @@
 from winops import set_dpi_awareness
 set_dpi_awareness()
 
+import atexit
 import time
 import os
-import re
-from datetime import datetime, timedelta
+import zlib
+from datetime import datetime
 from typing import Optional, Tuple
 import win32gui
 import win32con
-import pyautogui
 import numpy as np
 import cv2
 import subprocess
-import psutil
-import win32console
 import ctypes
-import csv
-import io
 import win32process
-import win32ui
-from ctypes import windll
+from ctypes import windll, wintypes
 from ocr import ocr_log_text
+from log_parse import find_latest_entry
 from utils import load_yaml, setup_logger
 from window_connector import find_hwnd_by_title_substring
 from layout import normalize_window_bottom_right
 from auto_updater import check_updates, get_status
 from heartbeat import write_heartbeat, sleep_with_heartbeat
-from winops import force_foreground
+from winops import force_foreground, safe_click, wait_for_input_idle
 from pathlib import Path
 
 
@@ -39,116 +35,196 @@ def exe_dir() -> str:
 BASE = exe_dir()
 APP_CFG_PATH = os.path.join(BASE, "config", "app.yaml")
 REGIONS_CFG_PATH = os.path.join(BASE, "config", "regions.yaml")
+LOGS_DIR = os.path.join(BASE, "logs")
+LAST_LOG_PATH = os.path.join(LOGS_DIR, "last_log.png")
+LAST_LOG_FALLBACK_PATH = os.path.join(LOGS_DIR, "last_log_fallback.png")
 
 
-# Matches log entries in the format "HH:MM | message"
-# Requires a pipe (or OCR variant) after the timestamp to avoid matching random numbers in messages
-ENTRY_RE = re.compile(
-    r"(?P<hh>[012]?\d)\s*:\s*(?P<mm>[0-5]\d)\s*[|\u00a6\uff5c\u4e28Il]\s*(?P<msg>.+?)(?=(?:[012]?\d)\s*:\s*[0-5]\d\s*[|\u00a6\uff5c\u4e28Il]|\Z)",
-    re.DOTALL,
-)
+def client_origin_screen(hwnd: int) -> Tuple[int, int]:
+    return win32gui.ClientToScreen(hwnd, (0, 0))
 
-# Pattern for "warm up"
-WARM_WORD_RE = re.compile(r"\bwarm[\s\-]*up\b", re.IGNORECASE)
 
-def normalize_for_match(s: str) -> str:
-    s = (s or "").lower()
-    s = s.replace("]", " ").replace("[", " ").replace("–", "'")
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+# hwnd -> (monotonic ts, window rect, (cw, ch, cx, cy)). A hit costs one
+# GetWindowRect instead of GetClientRect + ClientToScreen, and any move or
+# resize (ensure_normalized, the user) changes the window rect, so the
+# client geometry is re-read exactly when it could have changed.
+_GEOM_RECHECK_S = 2.0
+_geom_cache: dict = {}
 
-def normalize_text_for_parsing(text: str) -> str:
-    """
-    BULLETPROOF: Normalize OCR text before parsing.
-    Handles all common OCR misreads of pipe and timestamp characters.
-    """
-    if not text:
-        return ""
-    
-    # Replace various pipe-like characters with standard pipe
-    text = text.replace("｜", "|")  # Full-width pipe
-    text = text.replace("¦", "|")   # Broken bar
-    text = text.replace("丨", "|")  # CJK vertical line
-    
-    # OCR reads colon as period — only fix when followed by pipe (actual timestamp, not random N.N in messages)
-    text = re.sub(r'\b(\d{1,2})\.(\d{2})\s*([|\u00a6\uff5c\u4e28Il])', r'\1:\2 \3', text)
-    
-    # IMPROVED: Handle "I" and "l" as pipe in timestamp context
-    # Matches patterns like: "08:15I msg", "08:15 I msg", "8:5I msg"
-    text = re.sub(r'(\d{1,2}:\d{1,2})\s*I\s+', r'\1 | ', text)  # I after timestamp
-    text = re.sub(r'(\d{1,2}:\d{1,2})\s+l\s+', r'\1 | ', text)  # lowercase l
-    
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text.strip()
 
-def latest_msg_is_warm(msg: str) -> bool:
-    m = normalize_for_match(msg)
-    return bool(WARM_WORD_RE.search(m))
+def _client_geom(hwnd: int) -> Tuple[int, int, int, int]:
+    """(client_w, client_h, client_x, client_y) — size and screen origin."""
+    now = time.monotonic()
+    rect = win32gui.GetWindowRect(hwnd)
+    hit = _geom_cache.get(hwnd)
+    if hit is not None and hit[1] == rect and now - hit[0] < _GEOM_RECHECK_S:
+        return hit[2]
+    cl, ct, cr, cb = win32gui.GetClientRect(hwnd)
+    cx, cy = client_origin_screen(hwnd)
+    geom = (cr - cl, cb - ct, cx, cy)
+    if len(_geom_cache) > 32:
+        _geom_cache.clear()
+    _geom_cache[hwnd] = (now, rect, geom)
+    return geom
+
+# Private gdi32/user32 handles for the DIB-section capture (argtypes set here
+# don't leak into ctypes.windll for other modules). Handles are pointer-sized,
+# so every HDC/HBITMAP restype must be declared or it gets truncated on x64.
+_gdi32 = ctypes.WinDLL("gdi32")
+_cap_user32 = ctypes.WinDLL("user32")
+
+_cap_user32.GetDC.argtypes = [wintypes.HWND]
+_cap_user32.GetDC.restype = wintypes.HDC
+_cap_user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+_gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
+_gdi32.CreateCompatibleDC.restype = wintypes.HDC
+_gdi32.CreateDIBSection.argtypes = [
+    wintypes.HDC, ctypes.c_void_p, wintypes.UINT,
+    ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD,
+]
+_gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+_gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+_gdi32.SelectObject.restype = wintypes.HGDIOBJ
+_gdi32.BitBlt.argtypes = [
+    wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+    wintypes.HDC, ctypes.c_int, ctypes.c_int, wintypes.DWORD,
+]
+_gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+_gdi32.DeleteDC.argtypes = [wintypes.HDC]
+
+
+class _BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ("biSize", wintypes.DWORD),
+        ("biWidth", wintypes.LONG),
+        ("biHeight", wintypes.LONG),
+        ("biPlanes", wintypes.WORD),
+        ("biBitCount", wintypes.WORD),
+        ("biCompression", wintypes.DWORD),
+        ("biSizeImage", wintypes.DWORD),
+        ("biXPelsPerMeter", wintypes.LONG),
+        ("biYPelsPerMeter", wintypes.LONG),
+        ("biClrUsed", wintypes.DWORD),
+        ("biClrImportant", wintypes.DWORD),
+    ]
+
+
+def _dib_header(w: int, h: int) -> _BITMAPINFOHEADER:
+    # 32-bpp top-down (negative height) BI_RGB: rows come out in screen order
+    # and the pixel layout is exactly OpenCV's BGRA.
+    bih = _BITMAPINFOHEADER()
+    bih.biSize = ctypes.sizeof(_BITMAPINFOHEADER)
+    bih.biWidth = w
+    bih.biHeight = -h
+    bih.biPlanes = 1
+    bih.biBitCount = 32
+    bih.biCompression = 0  # BI_RGB
+    return bih
+
+
+# One memory DC + DIB section shared by every capture (logbox poll, first-run
+# detect region, ...), grown only when a larger region is requested; smaller
+# captures blit into its top-left corner. The window DC itself is still
+# taken per capture — GetDC/ReleaseDC are cheap, and holding one across polls
+# would tie up a shared DC and go stale when the panel restarts.
+_dib = None  # (memDC, hbmp, old_obj, view, w, h)
+
+
+def _release_dib() -> None:
+    global _dib
+    if _dib is None:
+        return
+    memDC, hbmp, old, _, _, _ = _dib
+    _dib = None
+    for release in (
+        lambda: _gdi32.SelectObject(memDC, old),
+        lambda: _gdi32.DeleteObject(hbmp),
+        lambda: _gdi32.DeleteDC(memDC),
+    ):
+        try:
+            release()
+        except Exception:
+            pass
 
-def minutes_since_hhmm(hh: int, mm: int) -> float:
-    now = datetime.now()
-    last = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
-    if last > now:
-        last -= timedelta(days=1)
-    return (now - last).total_seconds() / 60.0
 
-def client_origin_screen(hwnd: int) -> Tuple[int, int]:
-    return win32gui.ClientToScreen(hwnd, (0, 0))
+atexit.register(_release_dib)
+
+
+def _dib_section(w: int, h: int) -> tuple:
+    """(memDC, view) where view is an h x w BGRA window onto the shared DIB."""
+    global _dib
+    if _dib is None or w > _dib[4] or h > _dib[5]:
+        # Grow to cover both the old and the new size, so alternating
+        # between two region shapes doesn't reallocate every time.
+        dw, dh = (max(w, _dib[4]), max(h, _dib[5])) if _dib else (w, h)
+        _release_dib()
+        memDC = _gdi32.CreateCompatibleDC(None)  # screen-compatible
+        if not memDC:
+            raise OSError("CreateCompatibleDC failed")
+        bits = ctypes.c_void_p()
+        hbmp = _gdi32.CreateDIBSection(
+            memDC, ctypes.byref(_dib_header(dw, dh)), 0,  # DIB_RGB_COLORS
+            ctypes.byref(bits), None, 0,
+        )
+        if not hbmp or not bits.value:
+            _gdi32.DeleteDC(memDC)
+            raise OSError("CreateDIBSection failed")
+        old = _gdi32.SelectObject(memDC, hbmp)
+        view = np.ctypeslib.as_array(
+            (ctypes.c_ubyte * (dw * dh * 4)).from_address(bits.value)
+        ).reshape(dh, dw, 4)
+        _dib = (memDC, hbmp, old, view, dw, dh)
+    return _dib[0], _dib[3][:h, :w]
+
+
+def _blit_gray(src_hwnd, x: int, y: int, w: int, h: int) -> np.ndarray:
+    """BitBlt (x, y, w, h) of src_hwnd's client DC — or the whole screen when
+    src_hwnd is None — into the shared DIB section; returns it as grayscale."""
+    srcDC = None
+    try:
+        srcDC = _cap_user32.GetDC(src_hwnd)
+        if not srcDC:
+            return None
+        memDC, view = _dib_section(w, h)
+
+        if not _gdi32.BitBlt(memDC, 0, 0, w, h, srcDC, x, y, win32con.SRCCOPY):
+            return None
+        _gdi32.GdiFlush()  # GDI may batch the blit; finish it before reading bits
+
+        # OCR only needs luminance: one BGRA->GRAY pass instead of building a
+        # BGR copy that ocr_log_text reduces to gray anyway. cvtColor writes a
+        # fresh array — callers never hold a view into the shared DIB.
+        return cv2.cvtColor(view, cv2.COLOR_BGRA2GRAY)
+    except Exception:
+        # Don't reuse a section that just failed — release, recreate next call.
+        _release_dib()
+        return None
+    finally:
+        # The source DC is per-capture — always give it back, even on failure.
+        try:
+            if srcDC:
+                _cap_user32.ReleaseDC(src_hwnd, srcDC)
+        except Exception:
+            pass
+
 
 def capture_window_region_api(hwnd: int, x: int, y: int, w: int, h: int) -> np.ndarray:
     """
-    Capture window region using Windows API.
+    Capture window region using Windows API. Returns a grayscale image.
     
     CRITICAL FIX: Uses GetDC (client area) instead of GetWindowDC (entire window).
     This ensures coordinates are relative to CLIENT area, matching our percentage calculations.
+
+    BitBlt targets the shared DIB section, so the pixels land directly in memory
+    we view with numpy — per poll that's GetDC + BitBlt + ReleaseDC only.
     """
-    hwndDC = mfcDC = saveDC = saveBitMap = None
-    try:
-        # FIXED: Use GetDC (client area) not GetWindowDC (includes title bar)
-        hwndDC = win32gui.GetDC(hwnd)  # ← Changed from GetWindowDC
-        mfcDC = win32ui.CreateDCFromHandle(hwndDC)
-        saveDC = mfcDC.CreateCompatibleDC()
+    return _blit_gray(hwnd, x, y, w, h)
 
-        saveBitMap = win32ui.CreateBitmap()
-        saveBitMap.CreateCompatibleBitmap(mfcDC, w, h)
-        saveDC.SelectObject(saveBitMap)
 
-        # BitBlt from client area (x,y are now correct!)
-        saveDC.BitBlt((0, 0), (w, h), mfcDC, (x, y), win32con.SRCCOPY)
-
-        bmpstr = saveBitMap.GetBitmapBits(True)
-        img = np.frombuffer(bmpstr, dtype=np.uint8)
-        img.shape = (h, w, 4)
-
-        return cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-    except Exception:
-        return None
-    finally:
-        # Always release GDI objects — even on the exception path above.
-        # Skipping this on failure leaks a DC + bitmap every bad capture,
-        # which accumulates into steady RAM/GDI-handle growth over a long run.
-        try:
-            if saveBitMap is not None:
-                win32gui.DeleteObject(saveBitMap.GetHandle())
-        except Exception:
-            pass
-        try:
-            if saveDC is not None:
-                saveDC.DeleteDC()
-        except Exception:
-            pass
-        try:
-            if mfcDC is not None:
-                mfcDC.DeleteDC()
-        except Exception:
-            pass
-        try:
-            if hwndDC is not None:
-                win32gui.ReleaseDC(hwnd, hwndDC)
-        except Exception:
-            pass
+def capture_screen_region_dib(x: int, y: int, w: int, h: int) -> np.ndarray:
+    """Screen-coordinate grayscale capture through the same DIB section.
+    Sees what's actually on screen, so the region must be visible."""
+    return _blit_gray(None, x, y, w, h)
 
 
 def capture_logbox_client(hwnd: int, log_region: dict) -> np.ndarray:
@@ -169,18 +245,18 @@ def capture_logbox_client(hwnd: int, log_region: dict) -> np.ndarray:
     if img is not None:
         return img
 
-    # Fallback: pyautogui snapshots the actual screen, so the pixels must
-    # be visible. Only now do we try to bring the window forward.
+    # Fallback: a screen-DC blit only sees what's actually on screen, so the
+    # pixels must be visible. Only now do we try to bring the window forward.
     try:
         win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
         force_foreground(hwnd, tries=3, sleep_s=0.15)
     except Exception:
         pass
-    cx, cy = client_origin_screen(hwnd)
-    screen_left = cx + x
-    screen_top = cy + y
-    shot = pyautogui.screenshot(region=(screen_left, screen_top, w, h))
-    return cv2.cvtColor(np.array(shot), cv2.COLOR_RGB2BGR)
+    _, _, cx, cy = _client_geom(hwnd)
+    img = capture_screen_region_dib(cx + x, cy + y, w, h)
+    if img is None:
+        raise RuntimeError("Screen capture of log region failed")
+    return img
 
 
 _LAYOUT_CACHE = None
@@ -259,6 +335,7 @@ def dismiss_focus_blocker(target_hwnd: int, log=None) -> bool:
         if not pid:
             return False
         try:
+            import psutil
             image = psutil.Process(pid).name().lower()
         except Exception:
             return False
@@ -280,6 +357,7 @@ def dismiss_focus_blocker(target_hwnd: int, log=None) -> bool:
             return False
         subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid)],
                        capture_output=True, timeout=10)
+        _invalidate_process_snapshot()
         if log:
             log.warning("Killed focus blocker %r (pid=%d) blocking panel first-run", image, pid)
         print(f"   🔫 Killed focus blocker: {image} (pid={pid})")
@@ -359,9 +437,7 @@ def run_panel_first_run_if_needed(hwnd: int, regions: dict, log=None, force: boo
         # Only do OCR detection if not forced
         if detect and keywords:
             # convert pct region -> px region and OCR it
-            cl, ct, cr, cb = win32gui.GetClientRect(hwnd)
-            cw = cr - cl
-            ch = cb - ct
+            cw, ch, _, _ = _client_geom(hwnd)
             region_px = {
                 "x": int(float(detect["x"]) * cw),
                 "y": int(float(detect["y"]) * ch),
@@ -381,10 +457,7 @@ def run_panel_first_run_if_needed(hwnd: int, regions: dict, log=None, force: boo
     print(f"🖱️  Running {len(clicks)} first-run click(s)...")
 
     # click sequence (pct coords)
-    cl, ct, cr, cb = win32gui.GetClientRect(hwnd)
-    cw = cr - cl
-    ch = cb - ct
-    cx, cy = client_origin_screen(hwnd)
+    cw, ch, cx, cy = _client_geom(hwnd)
 
     for i, step in enumerate(clicks, 1):
         # Re-focus if lost (uses AttachThreadInput trick)
@@ -412,11 +485,8 @@ def run_panel_first_run_if_needed(hwnd: int, regions: dict, log=None, force: boo
     
         print(f"   Click {i}/{len(clicks)}: ({x_pct:.4f}, {y_pct:.4f}) -> screen ({x}, {y})")
         
-        # ANTI-SPAM: Use jitter to prevent Windows ignoring repeated clicks
-        pyautogui.moveRel(1, 0, duration=0)
-        pyautogui.moveRel(-1, 0, duration=0)
-        pyautogui.moveTo(x, y, duration=0.15)
-        pyautogui.click()
+        # ANTI-SPAM: safe_click jitters 1px first so repeated clicks aren't ignored
+        safe_click(x, y)
         
         # Wait after click
         time.sleep(wait_s)
@@ -429,27 +499,165 @@ def run_panel_first_run_if_needed(hwnd: int, regions: dict, log=None, force: boo
     print("✅ First-run clicks complete!")
     return True  # Success!
 
+# Toolhelp32 process walk: one kernel snapshot holds every (pid, exe name),
+# so listing names skips psutil's per-PID Process objects and queries.
+_TH32CS_SNAPPROCESS = 0x2
+_INVALID_HANDLE = wintypes.HANDLE(-1).value
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+
+class _PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", wintypes.LONG),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", wintypes.WCHAR * 260),
+    ]
+
+
+_kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+_kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+_kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+_kernel32.Process32FirstW.restype = wintypes.BOOL
+_kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+_kernel32.Process32NextW.restype = wintypes.BOOL
+_kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+
+def _toolhelp_processes() -> list:
+    snap = _kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+    if not snap or snap == _INVALID_HANDLE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        pe = _PROCESSENTRY32W()
+        pe.dwSize = ctypes.sizeof(_PROCESSENTRY32W)
+        out = []
+        ok = _kernel32.Process32FirstW(snap, ctypes.byref(pe))
+        while ok:
+            if pe.szExeFile:
+                out.append((pe.th32ProcessID, pe.szExeFile.lower()))
+            ok = _kernel32.Process32NextW(snap, ctypes.byref(pe))
+        return out
+    finally:
+        _kernel32.CloseHandle(snap)
+
+
+# One process-table sweep shared by the process checks below: a CS2 check runs
+# count_cs2_instances() and cs2_youngest_age_seconds() back to back, and each
+# used to walk the whole process table. Indexed once as {lowercased image
+# name: [pids]} so every check is a dict lookup; reused for
+# _PROC_SNAPSHOT_TTL_S and dropped whenever we start/kill something.
+_PROC_SNAPSHOT_TTL_S = 1.0
+_proc_snapshot = None
+_proc_snapshot_ts = 0.0
+
+
+def _process_snapshot() -> dict:
+    global _proc_snapshot, _proc_snapshot_ts
+    now = time.monotonic()
+    if _proc_snapshot is None or now - _proc_snapshot_ts >= _PROC_SNAPSHOT_TTL_S:
+        try:
+            procs = _toolhelp_processes()
+        except Exception:
+            import psutil
+            procs = [
+                (p.info["pid"], p.info["name"].lower())
+                for p in psutil.process_iter(["pid", "name"])
+                if p.info["name"]
+            ]
+        by_name = {}
+        for pid, name in procs:
+            by_name.setdefault(name, []).append(pid)
+        _proc_snapshot = by_name
+        _proc_snapshot_ts = now
+    return _proc_snapshot
+
+
+def _invalidate_process_snapshot() -> None:
+    global _proc_snapshot
+    _proc_snapshot = None
+
+
 def is_process_running(image_name: str) -> bool:
     """Windows-only: returns True if a process with this exact image name is running."""
     if not image_name:
         return False
+    # Same answer as `tasklist /FI "IMAGENAME eq ..."` without spawning it.
+    name = image_name.lower()
     try:
-        out = subprocess.check_output(
-            ["tasklist", "/FO", "CSV", "/NH", "/FI", f"IMAGENAME eq {image_name}"],
-            text=True,
-            errors="ignore"
-        )
-        # If no tasks match, tasklist outputs: INFO: No tasks are running...
-        if "No tasks are running" in out:
-            return False
-        # Parse CSV rows; first column is image name
-        reader = csv.reader(io.StringIO(out))
-        for row in reader:
-            if row and row[0].strip('"').lower() == image_name.lower():
-                return True
+        return name in _process_snapshot()
+    except Exception:
         return False
+
+# Poll sleeps wait on the panel's process handle instead of plain sleeping,
+# so a panel crash is noticed the moment it happens, not up to poll_seconds
+# later. The handle is kept between polls (and also pins the PID, so it
+# can't be reused by an unrelated process while we hold it).
+_SYNCHRONIZE = 0x00100000
+_WAIT_OBJECT_0 = 0
+_WAIT_TIMEOUT = 0x102
+_kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+_kernel32.OpenProcess.restype = wintypes.HANDLE
+_kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+_kernel32.WaitForSingleObject.restype = wintypes.DWORD
+_panel_proc = None  # (pid, process handle) of the panel window's owner
+
+
+def _forget_panel_process() -> None:
+    global _panel_proc
+    if _panel_proc is not None:
+        _kernel32.CloseHandle(_panel_proc[1])
+        _panel_proc = None
+
+
+def _panel_process_handle(hwnd: int):
+    global _panel_proc
+    try:
+        _, pid = win32process.GetWindowThreadProcessId(hwnd)
     except Exception:
+        return None
+    if _panel_proc is not None:
+        if _panel_proc[0] == pid:
+            return _panel_proc[1]
+        _forget_panel_process()
+    handle = _kernel32.OpenProcess(_SYNCHRONIZE, False, pid) if pid else None
+    if not handle:
+        return None
+    _panel_proc = (pid, handle)
+    return handle
+
+
+def sleep_until_panel_exit(hwnd, total_seconds: float, chunk_seconds: float = 30) -> bool:
+    """sleep_with_heartbeat("watchdog", ...) that wakes early if the panel
+    process behind hwnd exits. Returns True if it did."""
+    handle = _panel_process_handle(hwnd) if hwnd else None
+    if not handle:
+        sleep_with_heartbeat("watchdog", total_seconds, chunk_seconds)
         return False
+    end = time.monotonic() + total_seconds
+    while True:
+        write_heartbeat("watchdog")
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            return False
+        wait_ms = int(min(chunk_seconds, remaining) * 1000)
+        rc = _kernel32.WaitForSingleObject(handle, wait_ms)
+        if rc == _WAIT_OBJECT_0:
+            return True
+        if rc != _WAIT_TIMEOUT:
+            # WAIT_FAILED returns at once — looping on it would spin
+            # write_heartbeat until the deadline. Drop the handle and sleep
+            # out the rest the plain way.
+            _forget_panel_process()
+            sleep_with_heartbeat("watchdog", remaining, chunk_seconds)
+            return False
+
 
 def launch_steam_route_if_configured(regions, log=None):
     """Launch Steam Route if configured and not already running."""
@@ -489,6 +697,7 @@ def launch_steam_route_if_configured(regions, log=None):
             cwd=exe_dir,
             shell=False
         )
+        _invalidate_process_snapshot()
         
         if log: log.info("Launched Steam Route: %s", exe)
         print("✅ Steam Route launched successfully")
@@ -498,60 +707,6 @@ def launch_steam_route_if_configured(regions, log=None):
         print(f"❌ Failed to launch Steam Route: {e}")
 
 
-def find_latest_entry(text: str, debug=False) -> Tuple[Optional[float], Optional[int], Optional[int], Optional[str], Optional[str]]:
-    """
-    Parse OCR text for timestamped log entries (HH:MM | message).
-    Returns the entry whose timestamp is closest to the PC's current local time.
-    No entries are skipped — even very old timestamps are considered, because
-    if that's the only entry visible it tells us the log is stale.
-    """
-    if not text:
-        return None, None, None, None, None
-
-    text = normalize_text_for_parsing(text)
-
-    best_minutes = None
-    best_hh = None
-    best_mm = None
-    best_line = None
-    best_msg = None
-
-    all_matches = []
-
-    for m in ENTRY_RE.finditer(text):
-        hh = int(m.group("hh"))
-        mm = int(m.group("mm"))
-        msg = (m.group("msg") or "").strip()
-
-        # Skip empty messages
-        if len(msg) < 2:
-            continue
-
-        mins = minutes_since_hhmm(hh, mm)
-
-        if debug:
-            all_matches.append((hh, mm, mins, msg[:50]))
-
-        # Keep the entry closest to now (most recent)
-        if best_minutes is None or mins < best_minutes:
-            best_minutes = mins
-            best_hh = hh
-            best_mm = mm
-            compact_msg = re.sub(r"\s+", " ", msg).strip()
-            best_line = f"{hh:02d}:{mm:02d} | {compact_msg}"
-            best_msg = msg
-
-    # Debug output
-    if debug and all_matches:
-        now_str = datetime.now().strftime("%H:%M:%S")
-        print(f"   Found {len(all_matches)} timestamp(s) (PC time: {now_str}):")
-        for hh, mm, mins, msg in all_matches[:5]:
-            marker = ">>>" if (best_hh == hh and best_mm == mm) else "   "
-            print(f"   {marker} {hh:02d}:{mm:02d} ({mins:.1f} min ago) - {msg}")
-
-    return best_minutes, best_hh, best_mm, best_line, best_msg
-
-
 def trigger_recovery_action(hwnd: int, log, app, reason: str):
     log.warning("Recovery triggered: %s", reason)
 
@@ -568,24 +723,20 @@ def trigger_recovery_action(hwnd: int, log, app, reason: str):
 
     regions = load_yaml(REGIONS_CFG_PATH)
     if "button_point_pct" in regions:
-        cl, ct, cr, cb = win32gui.GetClientRect(hwnd)
-        cw = cr - cl
-        ch = cb - ct
-        cx, cy = client_origin_screen(hwnd)
+        cw, ch, cx, cy = _client_geom(hwnd)
         b = regions["button_point_pct"]
         x = cx + int(cw * float(b["x"]))
         y = cy + int(ch * float(b["y"]))
     elif "button_point" in regions:
         b = regions["button_point"]
-        cx, cy = client_origin_screen(hwnd)
+        _, _, cx, cy = _client_geom(hwnd)
         x = cx + int(b["x"])
         y = cy + int(b["y"])
     else:
         log.error("No button_point or button_point_pct in config.")
         return
 
-    pyautogui.moveTo(x, y, duration=0.15)
-    pyautogui.click()
+    safe_click(x, y)
     time.sleep(settle_click_ms / 1000)
     print(f"Recovery click at ({x}, {y})")
     log.info("Recovery click at (%d, %d)", x, y)
@@ -621,24 +772,32 @@ def resolve_panel_exe(regions: dict) -> Optional[str]:
         return str(panel_exe_path)
     
     # PRIORITY 2: Find any .exe files (for PCs with changing names)
-    exes = list(d.glob("*.exe"))
+    # One os.scandir pass: on Windows the DirEntry already carries the mtime
+    # from the directory listing, so no per-file stat for the sort or the
+    # printout below.
+    with os.scandir(d) as it:
+        exes = [
+            (e.name, e.path, e.stat().st_mtime)
+            for e in it
+            if e.name.lower().endswith(".exe") and e.is_file()
+        ]
     
     if not exes:
         print(f"❌ No .exe files found in: {panel_dir}")
         return None
 
     # Sort by modification time (newest first)
-    exes.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    exes.sort(key=lambda t: t[2], reverse=True)
     
-    newest_exe = str(exes[0])
+    newest_exe = exes[0][1]
     
     # Show what we found
     print(f"⚠️  Panel.exe not found, using newest .exe:")
     print(f"   📁 Found {len(exes)} .exe file(s) in {panel_dir}")
-    for i, exe in enumerate(exes[:3], 1):  # Show top 3
-        mtime = datetime.fromtimestamp(exe.stat().st_mtime)
+    for i, (name, _, mtime_ts) in enumerate(exes[:3], 1):  # Show top 3
+        mtime = datetime.fromtimestamp(mtime_ts)
         marker = "⭐" if i == 1 else "  "
-        print(f"   {marker} {exe.name} (modified: {mtime.strftime('%Y-%m-%d %H:%M:%S')})")
+        print(f"   {marker} {name} (modified: {mtime.strftime('%Y-%m-%d %H:%M:%S')})")
     if len(exes) > 3:
         print(f"   ... and {len(exes) - 3} more")
     
@@ -711,6 +870,7 @@ def restart_explorer(log=None):
             # Fallback: kill by PID of current session's explorer
             my_session = _current_session_id()
             explorer_pids = []
+            import psutil
             for proc in psutil.process_iter(['name', 'pid']):
                 try:
                     if proc.info['name'] and proc.info['name'].lower() == 'explorer.exe':
@@ -733,6 +893,7 @@ def restart_explorer(log=None):
                     )
                 time.sleep(1)
                 subprocess.Popen(["explorer.exe"], shell=False)
+                _invalidate_process_snapshot()
                 time.sleep(2)
                 print("✅ Explorer restarted (PID fallback)")
                 if log:
@@ -752,6 +913,7 @@ def restart_explorer(log=None):
         time.sleep(1)
 
         subprocess.Popen(["explorer.exe"], shell=False)
+        _invalidate_process_snapshot()
         time.sleep(2)
 
         print("✅ Explorer restarted")
@@ -776,48 +938,47 @@ def _current_session_id():
     return None
 
 
+def _session_cs2_pids() -> list:
+    """PIDs of cs2.exe processes in the CURRENT user session."""
+    my_session = _current_session_id()
+    pids = []
+    for pid in _process_snapshot().get('cs2.exe', ()):
+        if my_session is not None:
+            sess = ctypes.c_ulong()
+            if ctypes.windll.kernel32.ProcessIdToSessionId(pid, ctypes.byref(sess)):
+                if sess.value != my_session:
+                    continue
+        pids.append(pid)
+    return pids
+
+
 def count_cs2_instances():
     """Count CS2 instances in the CURRENT user session only.
 
     On multi-user PCs (2 users, 4 CS2 each = 8 total) we must only
     count the 4 that belong to our session, not all 8.
     """
-    my_session = _current_session_id()
-    count = 0
-    for proc in psutil.process_iter(['name', 'pid']):
-        try:
-            if proc.info['name'] and proc.info['name'].lower() == 'cs2.exe':
-                if my_session is not None:
-                    sess = ctypes.c_ulong()
-                    if ctypes.windll.kernel32.ProcessIdToSessionId(proc.info['pid'], ctypes.byref(sess)):
-                        if sess.value != my_session:
-                            continue
-                count += 1
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
-    return count
+    return len(_session_cs2_pids())
 
 
 def cs2_youngest_age_seconds():
     """Return age in seconds of the youngest cs2.exe in the current session,
     or None if no cs2.exe is running. Used to skip kill+relaunch while CS2
     is still mid-launch (replaces the old OCR-based 'Launching' detector)."""
-    my_session = _current_session_id()
+    pids = _session_cs2_pids()
+    if not pids:
+        return None
+    import psutil
     youngest = None
     now = time.time()
-    for proc in psutil.process_iter(['name', 'pid', 'create_time']):
+    for pid in pids:
         try:
-            if proc.info['name'] and proc.info['name'].lower() == 'cs2.exe':
-                if my_session is not None:
-                    sess = ctypes.c_ulong()
-                    if ctypes.windll.kernel32.ProcessIdToSessionId(proc.info['pid'], ctypes.byref(sess)):
-                        if sess.value != my_session:
-                            continue
-                age = now - proc.info['create_time']
-                if youngest is None or age < youngest:
-                    youngest = age
+            # create_time only for the handful of cs2 PIDs, not the whole table
+            age = now - psutil.Process(pid).create_time()
         except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
+            continue
+        if youngest is None or age < youngest:
+            youngest = age
     return youngest
 
 
@@ -882,13 +1043,11 @@ def check_cs2_instance_count(hwnd, regions, expected=4, log=None):
                 return False
         time.sleep(0.5)
 
-        cl, ct, cr, cb = win32gui.GetClientRect(hwnd)
-        cx, cy = client_origin_screen(hwnd)
-        x = cx + int((cr - cl) * float(kill_button["x"]))
-        y = cy + int((cb - ct) * float(kill_button["y"]))
+        cw, ch, cx, cy = _client_geom(hwnd)
+        x = cx + int(cw * float(kill_button["x"]))
+        y = cy + int(ch * float(kill_button["y"]))
 
-        pyautogui.moveTo(x, y, duration=0.15)
-        pyautogui.click()
+        safe_click(x, y)
         time.sleep(10)
 
         run_panel_first_run_if_needed(hwnd, regions, log=log, force=True)
@@ -904,6 +1063,7 @@ def check_cs2_instance_count(hwnd, regions, expected=4, log=None):
 def reposition_console_window():
     """Reposition console to bottom-left corner"""
     try:
+        import win32console
         console_hwnd = win32console.GetConsoleWindow()
         if not console_hwnd:
             return
@@ -932,6 +1092,11 @@ def reposition_console_window():
     except Exception as e:
         print(f"⚠️  Console reposition failed: {e}\n")
 
+# Debug snapshots: zlib level 1 (~3x faster than the default 3, barely bigger
+# on flat UI pixels).
+_PNG_FAST = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+
+
 def run_watchdog() -> None:
     # Write heartbeat immediately so a startup hang is detectable
     write_heartbeat("watchdog")
@@ -944,6 +1109,7 @@ def run_watchdog() -> None:
     app = load_yaml(APP_CFG_PATH)
 
     title_sub = app["window"]["title_substring"]
+    title_class = app["window"].get("class_name") or None
     width = int(app["layout"]["width"])
     height = int(app["layout"]["height"])
     margin_right = int(app["layout"].get("margin_right", 0))
@@ -961,11 +1127,14 @@ def run_watchdog() -> None:
     # Initialize normalize flag based on config
     normalize_every = bool(app["watchdog"].get("normalize_every_loop", True))
 
-    os.makedirs("logs", exist_ok=True)
+    # Created once here; write_heartbeat() re-creates it each loop if deleted.
+    os.makedirs(LOGS_DIR, exist_ok=True)
     hwnd = None
     last_found_title = None
     last_action_ts = 0.0
     last_logged_latest_line = None
+    last_img_key = None  # (shape, crc32) of the last OCR'd logbox capture
+    last_ocr_text = ""
     steam_route_launched = False
     first_run_completed_pids: dict[int, None] = {}  # insertion-ordered "set" of PIDs we've already onboarded
     last_explorer_restart_ts = time.time()  # Periodic explorer restart every 30 min
@@ -1008,7 +1177,7 @@ def run_watchdog() -> None:
 
         # Check window
         if hwnd is None or not win32gui.IsWindow(hwnd):
-            hwnd, last_found_title = find_hwnd_by_title_substring(title_sub)
+            hwnd, last_found_title = find_hwnd_by_title_substring(title_sub, title_class)
 
             if not hwnd:
                 print(f"Window not found. Launching panel...")
@@ -1027,7 +1196,9 @@ def run_watchdog() -> None:
                     log.warning("Launching Panel: %s", panel_exe)
                     exe_dir = os.path.dirname(panel_exe)
                     process = subprocess.Popen([panel_exe], cwd=exe_dir, shell=False)
+                    _invalidate_process_snapshot()
                     print(f"Launched panel (PID: {process.pid})")
+                    panel_idle = wait_for_input_idle(process.pid, 15000)
 
                     # if not steam_route_launched:
                     #     launch_steam_route_if_configured(regions, log=log)
@@ -1039,13 +1210,15 @@ def run_watchdog() -> None:
                     time.sleep(5)
                     continue
 
-                # Progressive retry to find window
-                retry_delays = [3, 5, 8, 12]
+                # Progressive retry to find window. Once the panel reports
+                # input-idle its window is normally up: look almost at once,
+                # keeping the long schedule only as a fallback.
+                retry_delays = [0.5, 3, 5, 8, 12] if panel_idle else [3, 5, 8, 12]
                 panel_dir = regions.get("panel", {}).get("dir", "")
 
                 for attempt, delay in enumerate(retry_delays, 1):
                     time.sleep(delay)
-                    hwnd, last_found_title = find_hwnd_by_title_substring(title_sub)
+                    hwnd, last_found_title = find_hwnd_by_title_substring(title_sub, title_class)
                     if hwnd:
                         break
                     if panel_dir:
@@ -1108,23 +1281,26 @@ def run_watchdog() -> None:
                     log.info("First-run completed for PID %d (deferred)", _pid)
                 else:
                     log.warning("First-run still failing for PID %d — will retry next loop", _pid)
-                    sleep_with_heartbeat("watchdog", poll)
+                    if sleep_until_panel_exit(hwnd, poll):
+                        hwnd = None
                     continue
         except Exception as _e:
             log.warning("First-run pending check failed: %s", _e)
 
         try:
-            cl, ct, cr, cb = win32gui.GetClientRect(hwnd)
-            client_w = cr - cl
-            client_h = cb - ct
+            client_w, client_h, _, _ = _client_geom(hwnd)
 
             if "log_region_pct" in regions:
                 r = regions["log_region_pct"]
+                # Optional top_fraction keeps only the top slice of the box
+                # (newest lines) — OCR cost scales with pixel count. Default
+                # 1.0: the stock region is already a single line.
+                top_fraction = min(1.0, max(0.05, float(r.get("top_fraction", 1.0))))
                 log_region = {
                     "x": int(r["x"] * client_w),
                     "y": int(r["y"] * client_h),
                     "w": int(r["w"] * client_w),
-                    "h": int(r["h"] * client_h),
+                    "h": max(1, int(r["h"] * top_fraction * client_h)),
                 }
             else:
                 log_region = regions.get("log_region")
@@ -1133,18 +1309,27 @@ def run_watchdog() -> None:
 
             img = capture_logbox_client(hwnd, log_region)
 
-            logs_dir = os.path.join(BASE, "logs")
-            os.makedirs(logs_dir, exist_ok=True)
-            cv2.imwrite(os.path.join(logs_dir, "last_log.png"), img)
+            # Most polls see the exact same logbox pixels as the last one:
+            # skip the PNG write and the Tesseract run, reuse the last text.
+            # Only the text is reused — find_latest_entry below still runs,
+            # since "minutes ago" moves on even when the logbox doesn't.
+            img_key = (img.shape, zlib.crc32(img))
+            if img_key == last_img_key:
+                text = last_ocr_text
+            else:
+                if save_last_log_image:
+                    cv2.imwrite(LAST_LOG_PATH, img, _PNG_FAST)
 
-            text = (ocr_log_text(img) or "").strip()
+                text = (ocr_log_text(img) or "").strip()
+                last_img_key, last_ocr_text = img_key, text
 
             if debug_print_ocr:
                 print(f"OCR: {text[:100]}...")
 
         except Exception as e:
             log.exception("Capture failed: %s", e)
-            sleep_with_heartbeat("watchdog", poll)
+            if sleep_until_panel_exit(hwnd, poll):
+                hwnd = None
             continue
 
         # Parse timestamps
@@ -1161,15 +1346,17 @@ def run_watchdog() -> None:
                 def _norm(s: str) -> str:
                     return (s or "").replace("\uff5c", "|").replace("\xa6", "|").replace("\u4e28", "|")
 
-                cx, cy = client_origin_screen(hwnd)
+                _, _, cx, cy = _client_geom(hwnd)
                 left = cx + int(log_region["x"])
                 top  = cy + int(log_region["y"])
                 w    = int(log_region["w"])
                 h    = int(log_region["h"])
 
-                shot = pyautogui.screenshot(region=(left, top, w, h))
-                img2 = cv2.cvtColor(np.array(shot), cv2.COLOR_RGB2BGR)
-                cv2.imwrite(os.path.join(logs_dir, "last_log_fallback.png"), img2)
+                img2 = capture_screen_region_dib(left, top, w, h)
+                if img2 is None:
+                    raise RuntimeError("screen capture returned nothing")
+                if save_last_log_image:
+                    cv2.imwrite(LAST_LOG_FALLBACK_PATH, img2, _PNG_FAST)
 
                 text2 = _norm((ocr_log_text(img2) or "").strip())
                 minutes_ago, hh, mm, latest_line, latest_msg = find_latest_entry(text2, debug=debug_print_ocr)
@@ -1179,7 +1366,8 @@ def run_watchdog() -> None:
 
         if minutes_ago is None:
             log.info("No parseable entry.")
-            sleep_with_heartbeat("watchdog", poll)
+            if sleep_until_panel_exit(hwnd, poll):
+                hwnd = None
             continue
 
         # Only print when the latest entry changes
@@ -1203,7 +1391,12 @@ def run_watchdog() -> None:
                 log.warning("Cooldown (%ds left). %s", int(remaining), trigger_reason)
             else:
                 print(f"RECOVERY: {trigger_reason}")
-                trigger_recovery_action(hwnd, log, app, trigger_reason)
+                try:
+                    trigger_recovery_action(hwnd, log, app, trigger_reason)
+                except Exception as e:
+                    # e.g. safe_click refusing an off-screen point — skip this
+                    # round (debounced like a real attempt) rather than crash
+                    log.exception("Recovery action failed: %s", e)
                 last_action_ts = now_ts
 
         # SteamRoute crash check (disabled)
@@ -1231,7 +1424,8 @@ def run_watchdog() -> None:
             check_cs2_instance_count(hwnd, regions, expected=4, log=log)
             last_cs2_check_ts = time.time()
 
-        sleep_with_heartbeat("watchdog", poll)
+        if sleep_until_panel_exit(hwnd, poll):
+            hwnd = None  # panel exited mid-sleep: relaunch now, not next poll
 
 if __name__ == "__main__":
     run_watchdog()
\ No newline at end of file
@@ -1,13 +1,33 @@
 import win32gui
 
-def find_hwnd_by_title_substring(substr: str):
+def find_hwnd_by_title_substring(substr: str, class_name: str = None):
     substr = (substr or "").lower()
+    if not substr:
+        return None, None  # nothing can match — don't walk the windows at all
+
+    # Known window class: FindWindowEx walks only windows of that class
+    # instead of reading the title of every top-level window.
+    if class_name:
+        hwnd = 0
+        while True:
+            try:
+                hwnd = win32gui.FindWindowEx(0, hwnd, class_name, None)
+            except Exception:
+                break  # class not registered / no more windows
+            if not hwnd:
+                break
+            if win32gui.IsWindowVisible(hwnd):
+                title = win32gui.GetWindowText(hwnd) or ""
+                if substr in title.lower():
+                    return hwnd, title
+
     matches = []
 
     def enum_handler(hwnd, _):
         if win32gui.IsWindowVisible(hwnd):
-            title = win32gui.GetWindowText(hwnd) or ""
-            if substr and substr in title.lower():
+            title = win32gui.GetWindowText(hwnd)
+            # most visible top-level windows are untitled: skip the lower() copy
+            if title and substr in title.lower():
                 matches.append((hwnd, title))
 
     win32gui.EnumWindows(enum_handler, None)
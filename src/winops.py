@@ -22,43 +22,101 @@ from typing import Callable, Optional, Tuple, List
 import win32con
 import win32gui
 import win32process
-import pyautogui
 
 
-def set_dpi_awareness() -> None:
-    """Make the process DPI-aware so Windows returns real pixel coordinates."""
+def _dll_func(dll_name: str, func_name: str, argtypes: list, restype=ctypes.c_int):
+    """Resolve a Win32 export once at import, or None if this Windows lacks it."""
     try:
-        # Per-monitor v2 (best)
-        ctypes.windll.user32.SetProcessDpiAwarenessContext(ctypes.c_void_p(-4))
-        return
-    except Exception:
-        pass
-    try:
-        # Per-monitor (Win 8.1+)
-        ctypes.windll.shcore.SetProcessDpiAwareness(2)
-        return
-    except Exception:
-        pass
-    try:
-        # System DPI aware (legacy)
-        ctypes.windll.user32.SetProcessDPIAware()
-    except Exception:
-        pass
+        fn = getattr(ctypes.WinDLL(dll_name, use_last_error=True), func_name)
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = argtypes
+    fn.restype = restype
+    return fn
+
+
+_SetProcessDpiAwarenessContext = _dll_func("user32", "SetProcessDpiAwarenessContext", [ctypes.c_void_p])  # Win10 1703+
+_SetProcessDpiAwareness = _dll_func("shcore", "SetProcessDpiAwareness", [ctypes.c_int])  # Win 8.1+
+_SetProcessDPIAware = _dll_func("user32", "SetProcessDPIAware", [])
+
+_ERROR_ACCESS_DENIED = 5
+_E_ACCESSDENIED = -2147024891  # HRESULT 0x80070005
+_dpi_mode: Optional[str] = None
+
+
+def set_dpi_awareness() -> str:
+    """Make the process DPI-aware so Windows returns real pixel coordinates.
+
+    Returns a short description of the mode in effect. Safe to call more than
+    once: awareness already set (by an earlier call, the manifest or a parent
+    process) counts as success rather than falling through to weaker modes.
+    """
+    global _dpi_mode
+    if _dpi_mode is not None:
+        return _dpi_mode
+
+    # Per-monitor v2 (best)
+    if _SetProcessDpiAwarenessContext is not None:
+        if _SetProcessDpiAwarenessContext(ctypes.c_void_p(-4)):
+            _dpi_mode = "Per-monitor v2"
+            return _dpi_mode
+        if ctypes.get_last_error() == _ERROR_ACCESS_DENIED:
+            _dpi_mode = "Already set"
+            return _dpi_mode
+    # Per-monitor (Win 8.1+)
+    if _SetProcessDpiAwareness is not None:
+        hr = _SetProcessDpiAwareness(2)
+        if hr == 0:
+            _dpi_mode = "Per-monitor"
+            return _dpi_mode
+        if hr == _E_ACCESSDENIED:
+            _dpi_mode = "Already set"
+            return _dpi_mode
+    # System DPI aware (legacy)
+    if _SetProcessDPIAware is not None and _SetProcessDPIAware():
+        _dpi_mode = "System DPI"
+        return _dpi_mode
+    return "None (might have issues)"
+
+
+_OpenProcess = _dll_func("kernel32", "OpenProcess", [ctypes.c_ulong, ctypes.c_int, ctypes.c_ulong], ctypes.c_void_p)
+_QueryFullProcessImageNameW = _dll_func(
+    "kernel32", "QueryFullProcessImageNameW",
+    [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_wchar_p, ctypes.POINTER(ctypes.c_ulong)],
+)
+_CloseHandle = _dll_func("kernel32", "CloseHandle", [ctypes.c_void_p])
+
+# find_window* resolve the exe of every visible window on every scan, and the
+# watchdog's launch retries rescan every few seconds: remember each PID's path
+# briefly (short TTL, so a recycled PID can't keep a stale path) and reuse
+# one buffer instead of allocating 4 KB per call.
+_IMAGE_NAME_TTL_S = 2.0
+_image_name_cache: dict = {}
+_image_name_buf = ctypes.create_unicode_buffer(2048)
 
 
 def _query_full_process_image_name(pid: int) -> str:
     """Return full exe path for a PID, or empty string."""
+    now = time.monotonic()
+    hit = _image_name_cache.get(pid)
+    if hit is not None and now - hit[0] < _IMAGE_NAME_TTL_S:
+        return hit[1]
+    path = ""
     try:
-        handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
-        if not handle:
-            return ""
-        buf = ctypes.create_unicode_buffer(2048)
-        size = ctypes.c_ulong(len(buf))
-        ok = ctypes.windll.kernel32.QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size))
-        ctypes.windll.kernel32.CloseHandle(handle)
-        return buf.value if ok else ""
+        handle = _OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if handle:
+            try:
+                size = ctypes.c_ulong(len(_image_name_buf))
+                if _QueryFullProcessImageNameW(handle, 0, _image_name_buf, ctypes.byref(size)):
+                    path = _image_name_buf.value
+            finally:
+                _CloseHandle(handle)
     except Exception:
-        return ""
+        path = ""
+    if len(_image_name_cache) > 256:
+        _image_name_cache.clear()
+    _image_name_cache[pid] = (now, path)
+    return path
 
 
 @dataclass
@@ -236,6 +294,25 @@ def wait_for_window_by_process(
     return None
 
 
+_WaitForInputIdle = _dll_func("user32", "WaitForInputIdle", [ctypes.c_void_p, ctypes.c_ulong], ctypes.c_ulong)
+
+
+def wait_for_input_idle(pid: int, timeout_ms: int = 15000) -> bool:
+    """Block until a freshly launched GUI process finishes initializing (its
+    message loop is waiting for input), up to timeout_ms. True if it did;
+    False on timeout, for console/headless processes, or if it can't be opened.
+    Returns the moment the process is ready instead of sleeping a fixed guess."""
+    if _OpenProcess is None or _WaitForInputIdle is None:
+        return False
+    handle = _OpenProcess(0x00100000 | 0x0400, False, pid)  # SYNCHRONIZE | PROCESS_QUERY_INFORMATION
+    if not handle:
+        return False
+    try:
+        return _WaitForInputIdle(handle, timeout_ms) == 0
+    finally:
+        _CloseHandle(handle)
+
+
 def launch_exe(exe_path: str) -> None:
     if not os.path.exists(exe_path):
         raise FileNotFoundError(exe_path)
@@ -272,22 +349,30 @@ def force_foreground(hwnd: int, tries: int = 8, sleep_s: float = 0.15) -> bool:
         if win32gui.GetForegroundWindow() == hwnd:
             return True
 
-        # thread attach trick
+        # thread attach trick — per attempt, since the foreground owner can
+        # change between attempts (a blocker popping up)
         try:
             fg = win32gui.GetForegroundWindow()
-            cur_tid = win32process.GetWindowThreadProcessId(fg)[0]
-            tgt_tid = win32process.GetWindowThreadProcessId(hwnd)[0]
             this_tid = ctypes.windll.kernel32.GetCurrentThreadId()
+            # attaching a thread to itself (or to 0) just fails — skip those
+            tids = {
+                win32process.GetWindowThreadProcessId(fg)[0] if fg else 0,
+                win32process.GetWindowThreadProcessId(hwnd)[0],
+            } - {0, this_tid}
+            attached = []
+            try:
+                for tid in tids:
+                    if ctypes.windll.user32.AttachThreadInput(this_tid, tid, True):
+                        attached.append(tid)
 
-            ctypes.windll.user32.AttachThreadInput(this_tid, cur_tid, True)
-            ctypes.windll.user32.AttachThreadInput(this_tid, tgt_tid, True)
-
-            win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-            win32gui.BringWindowToTop(hwnd)
-            win32gui.SetForegroundWindow(hwnd)
-
-            ctypes.windll.user32.AttachThreadInput(this_tid, cur_tid, False)
-            ctypes.windll.user32.AttachThreadInput(this_tid, tgt_tid, False)
+                win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+                win32gui.BringWindowToTop(hwnd)
+                win32gui.SetForegroundWindow(hwnd)
+            finally:
+                # always detach — a leaked attachment shares input state with
+                # that thread for the rest of the process's life
+                for tid in attached:
+                    ctypes.windll.user32.AttachThreadInput(this_tid, tid, False)
         except Exception:
             pass
 
@@ -338,14 +423,105 @@ def client_origin_screen(hwnd: int) -> Tuple[int, int]:
     return win32gui.ClientToScreen(hwnd, (0, 0))
 
 
-def pct_to_screen_xy(hwnd: int, x_pct: float, y_pct: float) -> Tuple[int, int]:
+# hwnd -> (monotonic ts, cw, ch, cx, cy), shared by every pct->screen caller.
+# Each caller picks how stale it can tolerate: clicks only a burst's worth
+# (a window moved by the user or by force_foreground's restore must be
+# re-read before the next click), screen-capture heuristics about a poll.
+_client_geom_cache: dict = {}
+
+
+def client_geom(hwnd: int, max_age_s: float = 0.2) -> Tuple[int, int, int, int]:
+    """(client width, client height, client origin x, y on screen), reusing
+    a reading of the same window up to max_age_s old."""
+    now = time.monotonic()
+    hit = _client_geom_cache.get(hwnd)
+    if hit is not None and now - hit[0] < max_age_s:
+        return hit[1:]
     cw, ch = client_size(hwnd)
     cx, cy = client_origin_screen(hwnd)
+    if len(_client_geom_cache) > 32:
+        _client_geom_cache.clear()
+    _client_geom_cache[hwnd] = (now, cw, ch, cx, cy)
+    return cw, ch, cx, cy
+
+
+def pct_to_screen_xy(hwnd: int, x_pct: float, y_pct: float) -> Tuple[int, int]:
+    cw, ch, cx, cy = client_geom(hwnd, max_age_s=0.2)
     return cx + int(cw * x_pct), cy + int(ch * y_pct)
 
 
-def safe_click(x: int, y: int, move_duration: float = 0.15) -> None:
+# ---- clicks: SetCursorPos + one SendInput batch ----------------------------
+# pyautogui tweens moveTo in a Python loop and sleeps PAUSE (0.1 s) after every
+# call — ~0.4 s per safe_click. Here the cursor is placed exactly with
+# SetCursorPos and the button events go out in ONE SendInput batch, so nothing
+# can interleave between down and up. pyautogui (PIL, pymsgbox, pyscreeze...)
+# is only imported as a fallback when SetCursorPos/SendInput/GetSystemMetrics
+# can't be resolved, or SendInput reports fewer events inserted than sent.
+
+_MOUSEEVENTF_LEFTDOWN = 0x0002
+_MOUSEEVENTF_LEFTUP = 0x0004
+_SM_XVIRTUALSCREEN, _SM_YVIRTUALSCREEN = 76, 77
+_SM_CXVIRTUALSCREEN, _SM_CYVIRTUALSCREEN = 78, 79
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUT(ctypes.Structure):
+    # MOUSEINPUT is the largest member of the INPUT union, so a one-member
+    # union gives the right sizeof() on both x86 and x64.
+    class _U(ctypes.Union):
+        _fields_ = [("mi", _MOUSEINPUT)]
+
+    _anonymous_ = ("u",)
+    _fields_ = [("type", ctypes.c_ulong), ("u", _U)]
+
+
+_SetCursorPos = _dll_func("user32", "SetCursorPos", [ctypes.c_int, ctypes.c_int])
+_SendInput = _dll_func("user32", "SendInput", [ctypes.c_uint, ctypes.c_void_p, ctypes.c_int], ctypes.c_uint)
+_GetSystemMetrics = _dll_func("user32", "GetSystemMetrics", [ctypes.c_int])
+
+# down, up, down, up: a single click sends the first two, a double click all four
+_CLICK_INPUTS = (_INPUT * 4)()
+for _i, _inp in enumerate(_CLICK_INPUTS):
+    _inp.type = 0  # INPUT_MOUSE
+    _inp.mi.dwFlags = _MOUSEEVENTF_LEFTUP if _i % 2 else _MOUSEEVENTF_LEFTDOWN
+del _i, _inp
+
+
+def _check_on_screen(x: int, y: int) -> None:
+    # Stand-in for pyautogui's fail-safe: a point computed from a minimized
+    # window's (-32000, -32000) rect must not become a click in a screen corner.
+    vx, vy = _GetSystemMetrics(_SM_XVIRTUALSCREEN), _GetSystemMetrics(_SM_YVIRTUALSCREEN)
+    vw, vh = _GetSystemMetrics(_SM_CXVIRTUALSCREEN), _GetSystemMetrics(_SM_CYVIRTUALSCREEN)
+    if not (vx <= x < vx + vw and vy <= y < vy + vh):
+        raise ValueError(f"click point ({x}, {y}) is off screen")
+
+
+def _send_clicks(x: int, y: int, clicks: int) -> bool:
+    if _SetCursorPos is None or _SendInput is None or _GetSystemMetrics is None:
+        return False
+    _check_on_screen(x, y)
     # tiny jitter to avoid Windows "same position" ignore in some setups
+    _SetCursorPos(x + 1, y)
+    _SetCursorPos(x, y)
+    n = 2 * clicks
+    return _SendInput(n, _CLICK_INPUTS, ctypes.sizeof(_INPUT)) == n
+
+
+def safe_click(x: int, y: int, move_duration: float = 0.15) -> None:
+    """move_duration only applies to the pyautogui fallback."""
+    if _send_clicks(x, y, 1):
+        return
+    import pyautogui
     pyautogui.moveRel(1, 0, duration=0)
     pyautogui.moveRel(-1, 0, duration=0)
     pyautogui.moveTo(x, y, duration=move_duration)
@@ -353,6 +529,11 @@ def safe_click(x: int, y: int, move_duration: float = 0.15) -> None:
 
 
 def safe_double_click(x: int, y: int, move_duration: float = 0.15, interval: float = 0.05) -> None:
+    """Both clicks go out in one batch, well inside the double-click time;
+    move_duration/interval only apply to the pyautogui fallback."""
+    if _send_clicks(x, y, 2):
+        return
+    import pyautogui
     pyautogui.moveRel(1, 0, duration=0)
     pyautogui.moveRel(-1, 0, duration=0)
     pyautogui.moveTo(x, y, duration=move_duration)